@@ -28,6 +28,12 @@ setup(
         "pandas>=1.3.0",  # Optional, for CSV export
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6",  # Faster config/case JSON
+            "msgpack>=1.0",  # Binary .msgpack case files
+            "pyarrow>=7.0",  # Faster CSV export
+            "numba>=0.53",  # Compiled stock-house flow/power kernels
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-qt>=4.0",
@@ -4,16 +4,42 @@ Enhanced Blast Furnace Integration Module
 Connects conveyor discharge to bunker charging sequence for realistic BF operation
 """
 
+import hashlib
+import os
+import pickle
+import sys
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.patches import Rectangle
 
 from ..models.simulation_data import SimulationResults, SimulationParameters
 from .bf_bunker_viz import BlastFurnaceBunker, MaterialLayer
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# On-disk cache for process_conveyor_discharge results (survives app restarts):
+# one <input hash>.pkl per distinct input under ~/.conveyor_model/cache/discharge.
+# The least recently used files are pruned on store beyond the file/byte caps;
+# deleting the directory is always safe.
+DISCHARGE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".conveyor_model", "cache", "discharge")
+DISCHARGE_CACHE_MAX_BYTES = 50 * 1024 * 1024  # Don't cache states larger than this
+DISCHARGE_CACHE_MAX_FILES = 64
+DISCHARGE_CACHE_MAX_TOTAL_BYTES = 500 * 1024 * 1024
+
+def _figure_canvas_class():
+    """Qt canvas class for on-screen use, or Agg when there is no display (imported on demand)"""
+    headless = (os.environ.get('MPLBACKEND', '').lower() == 'agg'
+                or (sys.platform.startswith('linux')
+                    and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))))
+    if headless:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        return FigureCanvasAgg
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    return FigureCanvasQTAgg
 
 @dataclass
 class TransferBin:
@@ -28,7 +54,7 @@ class TransferBin:
         if self.current_volume + volume > self.capacity:
             # Handle overflow - either reject or discharge to make space
             excess = (self.current_volume + volume) - self.capacity
-            print(f"Warning: Transfer bin overflow of {excess:.2f} m³")
+            logger.warning("Transfer bin overflow of %.2f m³", excess)
             volume = self.capacity - self.current_volume
         
         if volume > 0:
@@ -82,7 +108,13 @@ class ConveyorToBunkerSystem:
     bin_level_low_trigger: float = 0.2   # Stop discharge when 20% full
     
     def process_conveyor_discharge(self, simulation_results: SimulationResults):
-        """Process conveyor simulation results and feed to transfer bin"""
+        """
+        Process conveyor simulation results and feed to transfer bin
+        
+        The resulting bin and bunker state is cached on disk in
+        DISCHARGE_CACHE_DIR (~/.conveyor_model/cache/discharge), keyed on a
+        hash of every input, so identical runs are restored without reprocessing.
+        """
         self.conveyor_results = simulation_results
         
         if not hasattr(simulation_results.parameters, 'material_chemistry'):
@@ -90,11 +122,16 @@ class ConveyorToBunkerSystem:
         
         self.material_chemistry_db = simulation_results.parameters.material_chemistry
         
+        # Identical inputs always decompose to the same bin/bunker state
+        cache_key = self._discharge_cache_key(simulation_results)
+        if self._load_cached_discharge(cache_key):
+            return
+        
         # Process each time step of conveyor discharge
         time_array = simulation_results.get_time_array()
         flow_data = simulation_results.flow_data
         
-        print(f"Processing {len(time_array)} time steps of conveyor discharge...")
+        logger.debug("Processing %d time steps of conveyor discharge", len(time_array))
         
         for i, time_point in enumerate(time_array):
             if i >= flow_data.shape[0]:
@@ -114,6 +151,89 @@ class ConveyorToBunkerSystem:
             # Check if automatic discharge should occur
             if self.auto_discharge_enabled:
                 self._check_auto_discharge(time_point)
+        
+        self._store_cached_discharge(cache_key)
+    
+    def _discharge_cache_key(self, simulation_results: SimulationResults) -> str:
+        """Hash every input that affects the outcome of process_conveyor_discharge"""
+        flow_data = np.ascontiguousarray(simulation_results.flow_data)
+        key_data = (
+            simulation_results.parameters,
+            flow_data.shape, str(flow_data.dtype),
+            self.transfer_bin.capacity, self.transfer_bin.current_volume,
+            self.transfer_bin.material_layers,
+            self.bunker.diameter, self.bunker.height, self.bunker.layers,
+            self.bin_discharge_rate, self.auto_discharge_enabled,
+            self.bin_level_high_trigger, self.bin_level_low_trigger
+        )
+        key_hash = hashlib.blake2b(pickle.dumps(key_data), digest_size=20)
+        # flow_data is the bulk of the key; hash its buffer in place rather than copying it
+        key_hash.update(memoryview(flow_data))
+        return key_hash.hexdigest()
+    
+    def _load_cached_discharge(self, cache_key: str) -> bool:
+        """Restore bin and bunker state from the discharge cache, if present"""
+        cache_file = os.path.join(DISCHARGE_CACHE_DIR, f"{cache_key}.pkl")
+        if not os.path.exists(cache_file):
+            return False
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                bin_layers, bin_volume, bunker_layers = pickle.load(f)
+        except Exception as e:
+            logger.warning("Could not read discharge cache: %s", e)
+            return False
+        
+        self.transfer_bin.material_layers = bin_layers
+        self.transfer_bin.current_volume = bin_volume
+        self.bunker.layers = bunker_layers
+        try:
+            os.utime(cache_file)  # Mark as recently used so pruning keeps it
+        except OSError:
+            pass
+        logger.debug("Restored conveyor discharge from cache")
+        return True
+    
+    def _store_cached_discharge(self, cache_key: str):
+        """Write the processed bin and bunker state to the discharge cache"""
+        payload = pickle.dumps((
+            self.transfer_bin.material_layers,
+            self.transfer_bin.current_volume,
+            self.bunker.layers
+        ))
+        if len(payload) > DISCHARGE_CACHE_MAX_BYTES:
+            return
+        
+        try:
+            os.makedirs(DISCHARGE_CACHE_DIR, exist_ok=True)
+            cache_file = os.path.join(DISCHARGE_CACHE_DIR, f"{cache_key}.pkl")
+            tmp_file = f"{cache_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+            self._prune_discharge_cache()
+        except OSError as e:
+            logger.warning("Could not write discharge cache: %s", e)
+    
+    @staticmethod
+    def _prune_discharge_cache():
+        """Delete the least recently used cache files beyond the file count and size caps"""
+        entries = []
+        with os.scandir(DISCHARGE_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.pkl') and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        entries.sort(reverse=True)  # Most recently used first
+        total_bytes = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total_bytes += size
+            if count > DISCHARGE_CACHE_MAX_FILES or total_bytes > DISCHARGE_CACHE_MAX_TOTAL_BYTES:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Removed concurrently or not ours to delete; retried next store
     
     def _add_conveyor_materials_to_bin(self, material_flows: np.ndarray, dt: float, timestamp: float):
         """Add materials from conveyor discharge to transfer bin"""
@@ -155,13 +275,13 @@ class ConveyorToBunkerSystem:
                 timestamp=timestamp
             )
         
-        print(f"Discharged {volume:.2f} m³ to bunker at time {timestamp:.1f}s")
+        logger.debug("Discharged %.2f m³ to bunker at time %.1fs", volume, timestamp)
     
     def manual_discharge_to_bunker(self, volume: float, timestamp: float):
         """Manually discharge specified volume to bunker"""
         if volume > self.transfer_bin.current_volume:
             volume = self.transfer_bin.current_volume
-            print(f"Warning: Requested volume exceeds bin contents. Discharging {volume:.2f} m³")
+            logger.warning("Requested volume exceeds bin contents. Discharging %.2f m³", volume)
         
         self.discharge_to_bunker(volume, timestamp)
     
@@ -307,7 +427,7 @@ class ConveyorBunkerVisualization:
         if self.fig is not None:
             plt.close(self.fig)  # Close existing figure
         self.fig = plt.figure(figsize=figsize)
-        self.canvas = FigureCanvas(self.fig)
+        self.canvas = _figure_canvas_class()(self.fig)
         
         # Create 2x3 subplot layout
         gs = self.fig.add_gridspec(2, 3, height_ratios=[1, 1], width_ratios=[1, 1, 1])
@@ -341,7 +461,7 @@ class ConveyorBunkerVisualization:
         self._update_chemistry_plot()
         
         if self.fig is not None and hasattr(self.fig, 'canvas'):
-            self.fig.canvas.draw()
+            self.fig.canvas.draw_idle()
     
     def _update_conveyor_plot(self):
         """Update conveyor discharge plot"""
@@ -15,16 +15,26 @@ class MatrixCalculator:
             
         Returns:
             Shifted matrix with same dimensions
+            
+        Note:
+            Kept as public API for callers outside the engine.
+            SimulationEngine moves the belt as a ring buffer and does not
+            call this, so it is not on the simulation hot path.
         """
+        # No copy for C-contiguous arrays; lists and strided views are converted once
+        matrix = np.ascontiguousarray(matrix)
         if steps <= 0:
             return matrix.copy()
         
         rows, cols = matrix.shape
-        shifted_matrix = np.zeros_like(matrix)
+        if steps >= cols:
+            return np.zeros_like(matrix)
+        
+        shifted_matrix = np.empty_like(matrix)
         
         # Vectorized shifting - much faster than loops
-        if steps < cols:
-            shifted_matrix[:, steps:] = matrix[:, :-steps]
+        shifted_matrix[:, steps:] = matrix[:, :-steps]
+        shifted_matrix[:, :steps] = 0
         
         return shifted_matrix
     
@@ -52,16 +62,12 @@ class MatrixCalculator:
         
         # Extract material data (all columns except last 2)
         materials = flow_data[:, :-2]
-        totals = flow_data[:, -1]  # Last column is total
+        totals = flow_data[:, -1:]  # Last column is total, kept 2-D for broadcasting
         
-        # Avoid division by zero using masked operations
-        mask = totals > 0
-        proportions = np.zeros_like(materials)
-        proportions[mask] = (materials[mask] / totals[mask, np.newaxis]) * 100
-        with np.errstate(divide='ignore', invalid='ignore'):
-            proportions = np.divide(materials, totals[:, np.newaxis]) * 100
-            # Replace NaN and inf with 0
-            proportions[~np.isfinite(proportions)] = 0
+        # Divide straight into the output, skipping zero-total rows (left at 0)
+        proportions = np.zeros(materials.shape, dtype=np.float64)
+        np.divide(materials, totals, out=proportions, where=totals != 0)
+        proportions *= 100
         
         return proportions
     
@@ -1,4 +1,5 @@
 # src/simulation/engine.py
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from typing import List, Tuple, Dict
 from ..models.silo import Silo
@@ -10,8 +11,59 @@ from ..utils.exceptions import SimulationError, ValidationError
 from ..utils.logging import get_logger
 from typing import Optional, Union
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; run_simulation then uses the numpy loop
+    HAS_NUMBA = False
+
 logger = get_logger(__name__)
 
+def _run_scenario(parameters: 'SimulationParameters', bf_mode: bool) -> 'SimulationResults':
+    """Run one scenario in a fresh engine (module level so worker processes can unpickle it)"""
+    engine = SimulationEngine()
+    if bf_mode:
+        return engine.run_bf_simulation(parameters)
+    return engine.run_simulation(parameters)
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _run_conveyor_loop(material_matrix, flow_data, silo_rows, silo_cols, silo_quantity,
+                           silo_start, silo_end, dt, n_steps, step_size):
+        """
+        Compiled equivalent of the SimulationEngine.run_simulation time loop
+        
+        Deposits active silo quantities into the ring-buffered material matrix, records
+        the discharge segment into flow_data and advances the belt by step_size,
+        all in one pass per step with no allocations.
+        
+        Returns:
+            Ring-buffer head after the last step
+        """
+        n_materials, n_segments = material_matrix.shape
+        head = 0
+        for counter in range(n_steps + 1):
+            time = counter * dt
+            for i in range(silo_rows.shape[0]):
+                if silo_start[i] <= time <= silo_end[i]:
+                    material_matrix[silo_rows[i], (silo_cols[i] - head) % n_segments] += silo_quantity[i]
+            
+            discharge = (n_segments - 1 - head) % n_segments
+            total_flow = 0.0
+            for m in range(n_materials):
+                flow_data[counter, m] = material_matrix[m, discharge]
+                total_flow += material_matrix[m, discharge]
+            flow_data[counter, n_materials] = time
+            flow_data[counter, n_materials + 1] = total_flow
+            
+            leaving = (n_segments - step_size - head) % n_segments
+            for k in range(min(step_size, n_segments)):
+                column = (leaving + k) % n_segments
+                for m in range(n_materials):
+                    material_matrix[m, column] = 0.0
+            head = (head + step_size) % n_segments
+        return head
+
 class SimulationEngine:
     """Enhanced simulation engine for conveyor blending model with BF support"""
     
@@ -66,7 +118,8 @@ class SimulationEngine:
             raise SimulationError(f"Failed to initialize simulation: {e}")
         
         # Initialize matrices
-        material_matrix = np.zeros((n_materials, n_segments))
+        # float32 halves the bytes moved per step; tonnages need nowhere near float64 precision
+        material_matrix = np.zeros((n_materials, n_segments), dtype=np.float32)
         flow_data = np.zeros((n_steps + 1, n_materials + 2))  # +2 for time and total
         
         # Initialize chemistry tracking if BF mode
@@ -77,50 +130,85 @@ class SimulationEngine:
             )
         
         # Run simulation loop
-        time = 0.0
-        counter = 0
         step_size = max(1, round((conveyor.velocity * dt) / parameters.resolution_size))
-        
-        print(f"Starting simulation: {n_steps} steps, step_size={step_size}")
-        
-        while time <= parameters.total_time and counter <= n_steps:
-            # Process all active silos
-            for silo in parameters.silos:
-                if silo.is_active_at_time(time):
-                    quantity = silo.quantity_at_time(dt)
-                    self._add_material_to_conveyor(
-                        material_matrix, 
-                        silo.material_position, 
-                        silo.silo_position, 
-                        quantity
-                    )
-                    
-                    # Add chemistry data if BF mode
-                    if chemistry_matrix is not None:
+        # The matrices are ring buffers: conveyor segment c is stored in column
+        # (c - head) % n_segments, so moving the belt only advances head
+        head = 0
+        
+        logger.debug("Starting simulation: %d steps, step_size=%d", n_steps, step_size)
+        
+        # Flat silo arrays; silos outside the matrix are skipped as in _add_material_to_conveyor
+        silos = [silo for silo in parameters.silos
+                 if 0 <= silo.material_position < n_materials and 0 <= silo.silo_position < n_segments]
+        n_silos = len(silos)
+        silo_rows = np.fromiter((silo.material_position for silo in silos), dtype=np.int64, count=n_silos)
+        silo_cols = np.fromiter((silo.silo_position for silo in silos), dtype=np.int64, count=n_silos)
+        silo_flow = np.fromiter((silo.flow_rate for silo in silos), dtype=np.float64, count=n_silos)
+        silo_start = np.fromiter((silo.start_time for silo in silos), dtype=np.float64, count=n_silos)
+        silo_end = np.fromiter((silo.end_time() for silo in silos), dtype=np.float64, count=n_silos)
+        # Silo.quantity_at_time(dt) for every silo, rounded to the matrix dtype once
+        # so the compiled and numpy loops deposit identical values
+        silo_quantity = (silo_flow * dt).astype(np.float32)
+        
+        if chemistry_matrix is None and HAS_NUMBA:
+            head = _run_conveyor_loop(
+                material_matrix, flow_data, silo_rows, silo_cols, silo_quantity, silo_start, silo_end,
+                dt, n_steps, step_size
+            )
+        else:
+            # Deposits go through a flat view (material_matrix is C-contiguous and never
+            # rebound), indexed by row offset + ring-buffer column
+            material_flat = material_matrix.reshape(-1)
+            silo_row_offsets = silo_rows * n_segments
+            # Loop-invariant ring offsets of the discharge segment and the segments leaving the belt
+            last_segment = n_segments - 1
+            leaving_offset = n_segments - step_size
+            # Step times and silo activity for every step up front: (n_steps + 1, n_silos)
+            step_times = np.arange(n_steps + 1) * dt
+            active_schedule = ((silo_start <= step_times[:, np.newaxis]) &
+                               (step_times[:, np.newaxis] <= silo_end))
+            for counter in range(n_steps + 1):
+                time = step_times[counter]
+                # Process all active silos in one call; add.at accumulates silos sharing a cell
+                active = active_schedule[counter]
+                ring_cols = (silo_cols[active] - head) % n_segments
+                np.add.at(material_flat, silo_row_offsets[active] + ring_cols, silo_quantity[active])
+                
+                # Add chemistry data if BF mode
+                if chemistry_matrix is not None:
+                    for index in np.flatnonzero(active):
                         self._add_chemistry_to_conveyor(
                             chemistry_matrix,
-                            silo.material_position,
-                            silo.silo_position,
-                            quantity,
-                            parameters.material_chemistry
+                            int(silo_rows[index]),
+                            int(silo_cols[index]),
+                            float(silo_quantity[index]),
+                            parameters.material_chemistry,
+                            head
                         )
             
-            # Record current state
-            material_flows = material_matrix[:, -1]  # Material at end of conveyor
-            total_flow = np.sum(material_flows)
-            flow_data[counter, :] = np.concatenate([material_flows, [time], [total_flow]])
-            
-            # Move materials along conveyor
-            material_matrix = self.calculator.shift_matrix_right(material_matrix, step_size)
-            if chemistry_matrix is not None:
-                chemistry_matrix = self._shift_chemistry_matrix(chemistry_matrix, step_size)
+                # Record current state
+                discharge = (last_segment - head) % n_segments
+                material_flows = material_matrix[:, discharge]  # Material at end of conveyor
+                flow_data[counter, :n_materials] = material_flows
+                flow_data[counter, n_materials] = time
+                flow_data[counter, n_materials + 1] = material_flows.sum(dtype=np.float64)  # As the compiled loop
             
-            # Update time and counter
-            time += dt
-            counter += 1
-        
-        # Trim unused rows
-        flow_data = flow_data[:counter]
+                # Move materials along conveyor: clear the segments leaving the belt,
+                # which become the new leading segments once head advances
+                leaving = (leaving_offset - head) % n_segments
+                self._zero_ring_columns(material_matrix, leaving, step_size)
+                if chemistry_matrix is not None:
+                    self._zero_ring_columns(chemistry_matrix, leaving, step_size)
+                head = (head + step_size) % n_segments
+        
+        # Exactly n_steps + 1 steps were recorded, filling flow_data
+        counter = n_steps + 1
+        time = counter * dt
+        
+        # Put the ring buffers back in conveyor segment order
+        material_matrix = np.roll(material_matrix, head, axis=1)
+        if chemistry_matrix is not None:
+            chemistry_matrix = np.roll(chemistry_matrix, head, axis=1)
         
         # Calculate proportions
         proportion_data = self.calculator.calculate_proportions(flow_data)
@@ -169,6 +257,26 @@ class SimulationEngine:
         
         return results
     
+    def run_simulations(self, parameter_sets: List[SimulationParameters],
+                        max_workers: Optional[int] = None) -> List[SimulationResults]:
+        """
+        Run independent scenarios (e.g. a sweep over silo flows or timings) in parallel
+        
+        Args:
+            parameter_sets: One SimulationParameters per scenario
+            max_workers: Worker processes (default: one per CPU)
+            
+        Returns:
+            SimulationResults for each scenario, in input order
+        """
+        if len(parameter_sets) <= 1:
+            return [_run_scenario(parameters, self.bf_initialized) for parameters in parameter_sets]
+        
+        logger.info("Running %d scenarios in parallel", len(parameter_sets))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_run_scenario, parameter_sets,
+                                     [self.bf_initialized] * len(parameter_sets)))
+    
     def _initialize_chemistry_tracking(self, n_materials: int, n_segments: int, 
                                      material_chemistry: Dict) -> np.ndarray:
         """Initialize chemistry tracking matrix for BF mode"""
@@ -180,10 +288,11 @@ class SimulationEngine:
     
     def _add_chemistry_to_conveyor(self, chemistry_matrix: np.ndarray, 
                                  material_pos: int, silo_pos: int, quantity: float,
-                                 material_chemistry: Dict) -> None:
+                                 material_chemistry: Dict, head: int = 0) -> None:
         """Add chemistry data when material is added to conveyor"""
         if (0 <= material_pos < chemistry_matrix.shape[0] and 
             0 <= silo_pos < chemistry_matrix.shape[1]):
+            silo_pos = (silo_pos - head) % chemistry_matrix.shape[1]
             
             # Get material name from position
             materials = list(material_chemistry.keys())
@@ -199,43 +308,6 @@ class SimulationEngine:
                 chemistry_matrix[material_pos, silo_pos, 3] += chemistry.get('MgO', 0) * weight
                 chemistry_matrix[material_pos, silo_pos, 4] += chemistry.get('Al2O3', 0) * weight
     
-    def _shift_chemistry_matrix(self, chemistry_matrix: np.ndarray, steps: int) -> np.ndarray:
-        """
-        Shift chemistry matrix contents right by specified steps using vectorized operations
-        
-        Args:
-            chemistry_matrix: Input matrix to shift
-            steps: Number of positions to shift right
-            
-        Returns:
-            Shifted matrix with same dimensions
-            
-        Note:
-            Uses vectorized NumPy operations for improved performance
-        """
-        if steps <= 0:
-            return chemistry_matrix
-            
-        rows, cols = chemistry_matrix.shape
-        shifted = np.zeros_like(chemistry_matrix)
-        
-        if steps < cols:
-            # Vectorized shift operation
-            shifted[:, steps:] = chemistry_matrix[:, :-steps]
-        
-        return shifted
-        """Shift chemistry matrix along with material matrix"""
-        if steps <= 0:
-            return chemistry_matrix.copy()
-        
-        materials, segments, components = chemistry_matrix.shape
-        shifted_matrix = np.zeros_like(chemistry_matrix)
-        
-        if steps < segments:
-            shifted_matrix[:, steps:, :] = chemistry_matrix[:, :-steps, :]
-        
-        return shifted_matrix
-    
     def _calculate_chemistry_trends(self, chemistry_matrix: np.ndarray, 
                                   flow_data: np.ndarray,
                                   parameters: SimulationParameters) -> Dict:
@@ -327,11 +399,25 @@ class SimulationEngine:
         return results
     
     def _add_material_to_conveyor(self, matrix: np.ndarray, material_pos: int, 
-                                  silo_pos: int, quantity: float) -> None:
-        """Add material quantity to specific position on conveyor"""
+                                  silo_pos: int, quantity: float, head: int = 0) -> None:
+        """Add material quantity to specific position on conveyor (ring buffer offset by head)"""
         if (0 <= material_pos < matrix.shape[0] and 
             0 <= silo_pos < matrix.shape[1]):
-            matrix[material_pos, silo_pos] += quantity
+            matrix[material_pos, (silo_pos - head) % matrix.shape[1]] += quantity
+    
+    @staticmethod
+    def _zero_ring_columns(matrix: np.ndarray, start: int, count: int) -> None:
+        """Zero count columns (axis 1) of a ring buffer from start, wrapping at the end"""
+        cols = matrix.shape[1]
+        if count >= cols:
+            matrix[:] = 0
+            return
+        end = start + count
+        if end <= cols:
+            matrix[:, start:end] = 0
+        else:
+            matrix[:, start:] = 0
+            matrix[:, :end - cols] = 0
     
     def calculate_bunker_chemistry(self, bunker_data: Dict) -> Dict:
         """Calculate chemistry for bunker discharge - BF specific feature"""
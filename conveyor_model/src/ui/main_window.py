@@ -76,7 +76,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1400, 800)
         
         # Initialize components
-        self.file_handler = FileHandler()
+        self.file_handler = FileHandler(cache=True)
         self.current_results = None
         self.simulation_worker = None
 
@@ -163,7 +163,7 @@ class MainWindow(QMainWindow):
         # Modified silo table for BF bunkers
         self.bf_silo_table = SiloTable()
         # Customize column headers for BF
-        self.bf_silo_table.table.setHorizontalHeaderLabels(
+        self.bf_silo_table.set_header_labels(
             ['Material', 'Bunker Volume [m³]', 'Flow [t/h]', 
              'Material Position', 'Bunker Position', 'Start Time [s]']
         )
@@ -823,7 +823,7 @@ class MainWindow(QMainWindow):
                 ax.text(0.5, 0.5, 'No chemistry data available\nCheck BF mode and materials', 
                     ha='center', va='center', transform=ax.transAxes, fontsize=12)
             self.bf_figure.tight_layout()
-            self.bf_canvas.draw()
+            self.bf_canvas.draw_idle()
             return
         
         time_points = chemistry_trends['time_points']
@@ -916,7 +916,7 @@ class MainWindow(QMainWindow):
                 ax.set_xlabel('Time (s)')
         
         self.bf_figure.tight_layout()
-        self.bf_canvas.draw()
+        self.bf_canvas.draw_idle()
 
         def _calculate_chemistry_time_series(self, results: SimulationResults) -> Dict:
             """Calculate weighted average chemistry at conveyor discharge over time"""
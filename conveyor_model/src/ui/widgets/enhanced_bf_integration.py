@@ -13,6 +13,8 @@ from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+import functools
+import time
 import numpy as np
 from typing import Dict, List, Optional
 
@@ -23,6 +25,11 @@ from ...simulation.bf_conveyor_bunker_integration import (
 from ...simulation.bf_bunker_viz import BlastFurnaceBunker
 from ...models.simulation_data import SimulationResults
 
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a wall-clock second as hh:mm:ss (memoized for same-second messages)"""
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
+
 class ConveyorToBunkerControlWidget(QWidget):
     """Main control widget for conveyor-to-bunker system"""
     
@@ -33,8 +40,17 @@ class ConveyorToBunkerControlWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.system = None
+        self._has_chemistry = False
+        self._auto_update_paused = False
         self.auto_update_timer = QTimer()
         self.auto_update_timer.timeout.connect(self.update_displays)
+        
+        # Status messages are buffered and flushed once per event-loop turn
+        self._status_buffer: List[str] = []
+        self._status_flush_timer = QTimer()
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(16)
+        self._status_flush_timer.timeout.connect(self._flush_status)
         self.setup_ui()
         
     def setup_ui(self):
@@ -230,7 +246,8 @@ class ConveyorToBunkerControlWidget(QWidget):
         """Set conveyor results from main application"""
         if self.system:
             self.system.conveyor_results = results
-            if hasattr(results.parameters, 'material_chemistry'):
+            self._has_chemistry = 'material_chemistry' in getattr(results.parameters, '__dict__', {})
+            if self._has_chemistry:
                 self.system.material_chemistry_db = results.parameters.material_chemistry
                 self.update_status("Conveyor results loaded with chemistry data.")
                 self.process_discharge_btn.setEnabled(True)
@@ -305,11 +322,28 @@ class ConveyorToBunkerControlWidget(QWidget):
             self.system.bin_level_high_trigger = self.high_trigger_spin.value()
             self.system.bin_level_low_trigger = self.low_trigger_spin.value()
     
+    def pause_auto_update(self):
+        """Stop the monitoring timer while the displays cannot be seen"""
+        if self.auto_update_timer.isActive():
+            self.auto_update_timer.stop()
+            self._auto_update_paused = True
+    
+    def resume_auto_update(self):
+        """Restart the monitoring timer stopped by pause_auto_update"""
+        if self._auto_update_paused:
+            self._auto_update_paused = False
+            self.auto_update_timer.start(1000)
+            self.update_displays()
+    
     def update_displays(self):
         """Update all displays with current system status"""
         if not self.system:
             return
         
+        # Skip the work entirely while hidden or fully obscured
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+        
         # Update progress bars
         bin_status = self.system.get_bin_status()
         self.bin_fill_progress.setValue(int(bin_status['fill_percentage']))
@@ -337,21 +371,24 @@ class ConveyorToBunkerControlWidget(QWidget):
     def update_status(self, message: str = None):
         """Update status display"""
         if message:
-            current_text = self.status_text.toPlainText()
-            timestamp = QTimer().time().toString("hh:mm:ss")
-            new_line = f"[{timestamp}] {message}"
-            
-            if current_text:
-                updated_text = f"{current_text}\n{new_line}"
-            else:
-                updated_text = new_line
+            timestamp = _format_timestamp(int(time.time()))
+            self._status_buffer.append(f"[{timestamp}] {message}")
             
-            self.status_text.setPlainText(updated_text)
-            
-            # Auto-scroll to bottom
-            cursor = self.status_text.textCursor()
-            cursor.movePosition(cursor.End)
-            self.status_text.setTextCursor(cursor)
+            if not self._status_flush_timer.isActive():
+                self._status_flush_timer.start()
+    
+    def _flush_status(self):
+        """Append all buffered status messages in a single document update"""
+        if not self._status_buffer:
+            return
+        
+        self.status_text.append("\n".join(self._status_buffer))
+        self._status_buffer.clear()
+        
+        # Auto-scroll to bottom
+        cursor = self.status_text.textCursor()
+        cursor.movePosition(cursor.End)
+        self.status_text.setTextCursor(cursor)
     
     def export_report(self):
         """Export material flow report"""
@@ -397,6 +434,9 @@ class EnhancedBFIntegrationWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.conveyor_results = None
+        self.system_viz = None
+        self._viz_ready = False
+        self._pending_draw = False
         self.setup_ui()
     
     def setup_ui(self):
@@ -447,8 +487,28 @@ class EnhancedBFIntegrationWidget(QWidget):
         self.control_widget.system_updated.connect(self.update_visualization)
         self.control_widget.material_transferred.connect(self.on_material_transferred)
         
-        # Initialize visualization
+        # Visualization is built lazily on first show/tab change
+        self.viz_tabs.currentChanged.connect(self._ensure_viz)
+    
+    def showEvent(self, event):
+        """Build the visualization the first time the widget is shown"""
+        super().showEvent(event)
+        self._ensure_viz()
+        self.control_widget.resume_auto_update()
+    
+    def hideEvent(self, event):
+        """Stop periodic display updates while the window is hidden"""
+        super().hideEvent(event)
+        self.control_widget.pause_auto_update()
+    
+    def _ensure_viz(self, *args):
+        """Create the matplotlib figure, canvas and toolbar on first use only"""
+        if self._viz_ready:
+            return
+        self._viz_ready = True
         self.setup_visualization()
+        if self.conveyor_results is not None:
+            self.update_visualization()
     
     def setup_visualization(self):
         """Setup the visualization components"""
@@ -473,8 +533,16 @@ class EnhancedBFIntegrationWidget(QWidget):
         self.update_visualization()
     
     def update_visualization(self):
-        """Update all visualizations"""
-        if hasattr(self, 'system_viz') and self.system_viz:
+        """Schedule a visualization update, coalescing repeated requests"""
+        if self.system_viz is None or self._pending_draw:
+            return
+        self._pending_draw = True
+        QTimer.singleShot(0, self._draw_visualization)
+    
+    def _draw_visualization(self):
+        """Run the pending visualization update"""
+        self._pending_draw = False
+        if self.system_viz is not None:
             self.system_viz.update_visualization()
     
     def on_material_transferred(self, volume: float):
@@ -483,6 +551,69 @@ class EnhancedBFIntegrationWidget(QWidget):
         print(f"Material transferred: {volume:.1f} m³")
 
 # Integration with main window
+class _EnhancedBFHandlers:
+    """Enhanced replacements for main window handlers, bound once per window"""
+    
+    def __init__(self, main_window, original_on_simulation_finished):
+        self.main_window = main_window
+        self.original_on_simulation_finished = original_on_simulation_finished
+        self.original_toggle_bf_mode = None
+    
+    def show_bf_bunker_visualization(self):
+        """Enhanced bunker visualization with conveyor integration"""
+        main_window = self.main_window
+        if not main_window.bf_mode_enabled:
+            QMessageBox.warning(
+                main_window,
+                "BF Mode Required",
+                "Please enable Blast Furnace Mode first."
+            )
+            return
+        
+        # Create or show the enhanced BF window
+        if not main_window.enhanced_bf_widget:
+            main_window.enhanced_bf_widget = EnhancedBFIntegrationWidget()
+            main_window.enhanced_bf_widget.setWindowTitle(
+                'Enhanced Blast Furnace: Conveyor to Bunker Integration'
+            )
+            main_window.enhanced_bf_widget.resize(1400, 900)
+            
+            # Connect to simulation results
+            if getattr(main_window, 'current_results', None):
+                main_window.enhanced_bf_widget.set_conveyor_results(main_window.current_results)
+        
+        main_window.enhanced_bf_widget.show()
+        main_window.enhanced_bf_widget.raise_()
+        main_window.enhanced_bf_widget.activateWindow()
+    
+    def on_simulation_finished(self, results):
+        """Enhanced simulation completion handler"""
+        # Call original handler
+        self.original_on_simulation_finished(results)
+        
+        # Update enhanced BF widget if open and in BF mode
+        main_window = self.main_window
+        if (main_window.bf_mode_enabled and 
+            main_window.enhanced_bf_widget and 
+            main_window.enhanced_bf_widget.isVisible()):
+            main_window.enhanced_bf_widget.set_conveyor_results(results)
+    
+    def toggle_bf_mode(self, checked):
+        """Enhanced BF mode toggle"""
+        self.original_toggle_bf_mode(checked)
+        
+        main_window = self.main_window
+        
+        # Enable/disable enhanced features
+        enhanced_action = getattr(main_window, 'enhanced_bf_action', None)
+        if enhanced_action is not None:
+            enhanced_action.setEnabled(checked)
+        
+        # Close enhanced widget if disabling BF mode
+        if not checked and main_window.enhanced_bf_widget:
+            main_window.enhanced_bf_widget.close()
+            main_window.enhanced_bf_widget = None
+
 class EnhancedMainWindowIntegration:
     """Helper class to integrate enhanced BF features into main window"""
     
@@ -493,54 +624,12 @@ class EnhancedMainWindowIntegration:
         # Store reference to enhanced widget
         main_window.enhanced_bf_widget = None
         
-        # Modify the show_bf_bunker_visualization method
-        original_show_bf_bunker = main_window.show_bf_bunker_visualization
-        
-        def enhanced_show_bf_bunker_visualization():
-            """Enhanced bunker visualization with conveyor integration"""
-            if not main_window.bf_mode_enabled:
-                QMessageBox.warning(
-                    main_window,
-                    "BF Mode Required",
-                    "Please enable Blast Furnace Mode first."
-                )
-                return
-            
-            # Create or show the enhanced BF window
-            if not main_window.enhanced_bf_widget:
-                main_window.enhanced_bf_widget = EnhancedBFIntegrationWidget()
-                main_window.enhanced_bf_widget.setWindowTitle(
-                    'Enhanced Blast Furnace: Conveyor to Bunker Integration'
-                )
-                main_window.enhanced_bf_widget.resize(1400, 900)
-                
-                # Connect to simulation results
-                if hasattr(main_window, 'current_results') and main_window.current_results:
-                    main_window.enhanced_bf_widget.set_conveyor_results(main_window.current_results)
-            
-            main_window.enhanced_bf_widget.show()
-            main_window.enhanced_bf_widget.raise_()
-            main_window.enhanced_bf_widget.activateWindow()
-        
-        # Replace the method
-        main_window.show_bf_bunker_visualization = enhanced_show_bf_bunker_visualization
-        
-        # Modify the simulation completion handler
-        original_on_simulation_finished = main_window.on_simulation_finished
-        
-        def enhanced_on_simulation_finished(results):
-            """Enhanced simulation completion handler"""
-            # Call original handler
-            original_on_simulation_finished(results)
-            
-            # Update enhanced BF widget if open and in BF mode
-            if (main_window.bf_mode_enabled and 
-                main_window.enhanced_bf_widget and 
-                main_window.enhanced_bf_widget.isVisible()):
-                main_window.enhanced_bf_widget.set_conveyor_results(results)
+        handlers = _EnhancedBFHandlers(main_window, main_window.on_simulation_finished)
+        main_window._enhanced_bf_handlers = handlers
         
-        # Replace the method
-        main_window.on_simulation_finished = enhanced_on_simulation_finished
+        # Replace the bunker visualization and simulation completion handlers
+        main_window.show_bf_bunker_visualization = handlers.show_bf_bunker_visualization
+        main_window.on_simulation_finished = handlers.on_simulation_finished
         
         # Add menu item for enhanced features
         bf_menu = None
@@ -554,29 +643,15 @@ class EnhancedMainWindowIntegration:
             
             enhanced_action = bf_menu.addAction('&Enhanced Conveyor-Bunker Integration')
             enhanced_action.setShortcut('Ctrl+Shift+B')
-            enhanced_action.triggered.connect(enhanced_show_bf_bunker_visualization)
+            enhanced_action.triggered.connect(handlers.show_bf_bunker_visualization)
             enhanced_action.setEnabled(main_window.bf_mode_enabled)
             
             # Store reference for enabling/disabling
             main_window.enhanced_bf_action = enhanced_action
             
             # Update the toggle_bf_mode method to handle enhanced features
-            original_toggle_bf_mode = main_window.toggle_bf_mode
-            
-            def enhanced_toggle_bf_mode(checked):
-                """Enhanced BF mode toggle"""
-                original_toggle_bf_mode(checked)
-                
-                # Enable/disable enhanced features
-                if hasattr(main_window, 'enhanced_bf_action'):
-                    main_window.enhanced_bf_action.setEnabled(checked)
-                
-                # Close enhanced widget if disabling BF mode
-                if not checked and main_window.enhanced_bf_widget:
-                    main_window.enhanced_bf_widget.close()
-                    main_window.enhanced_bf_widget = None
-            
-            main_window.toggle_bf_mode = enhanced_toggle_bf_mode
+            handlers.original_toggle_bf_mode = main_window.toggle_bf_mode
+            main_window.toggle_bf_mode = handlers.toggle_bf_mode
 
 # Usage example for integration
 def integrate_enhanced_bf_features(main_window_instance):
@@ -54,6 +54,14 @@ class InputPanel(QWidget):
         group.setLayout(form_layout)
         layout.addWidget(group)
         
+        # Parameter name -> input widget, used by get/set_parameters
+        self._fields = {
+            'total_time': self.total_time_input,
+            'conveyor_length': self.length_input,
+            'resolution_size': self.resolution_input,
+            'conveyor_velocity': self.velocity_input
+        }
+        
         # Run button
         self.run_button = QPushButton("Run Simulation")
         self.run_button.clicked.connect(self.run_requested.emit)
@@ -64,23 +72,15 @@ class InputPanel(QWidget):
     
     def get_parameters(self) -> dict:
         """Get current parameter values"""
-        return {
-            'total_time': self.total_time_input.value(),
-            'conveyor_length': self.length_input.value(),
-            'resolution_size': self.resolution_input.value(),
-            'conveyor_velocity': self.velocity_input.value()
-        }
+        return {name: widget.value() for name, widget in self._fields.items()}
     
     def set_parameters(self, params: dict):
         """Set parameter values"""
-        if 'total_time' in params:
-            self.total_time_input.setValue(float(params['total_time']))
-        if 'conveyor_length' in params:
-            self.length_input.setValue(float(params['conveyor_length']))
-        if 'resolution_size' in params:
-            self.resolution_input.setValue(float(params['resolution_size']))
-        if 'conveyor_velocity' in params:
-            self.velocity_input.setValue(float(params['conveyor_velocity']))
+        fields = self._fields
+        for name, value in params.items():
+            widget = fields.get(name)
+            if widget is not None:
+                widget.setValue(float(value))
     
     def clear(self):
         """Reset to default values"""
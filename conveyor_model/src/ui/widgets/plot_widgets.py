@@ -1,10 +1,8 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QGroupBox, QFileDialog, QMessageBox, QApplication)
+                             QGroupBox, QFileDialog, QApplication)
 from PyQt5.QtCore import Qt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from ...visualization.plotter import ConveyorPlotter
 from ...models.simulation_data import SimulationResults
+from ..dialogs.error_dialog import ErrorDialog
 
 class PlotWidget(QWidget):
     """Widget containing matplotlib plots"""
@@ -14,6 +12,11 @@ class PlotWidget(QWidget):
         self.setup_ui()
     
     def setup_ui(self):
+        # matplotlib is imported here so importing the module stays cheap
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from ...visualization.plotter import ConveyorPlotter
+        
         layout = QVBoxLayout()
         
         # Group box for plots
@@ -46,9 +49,17 @@ class PlotWidget(QWidget):
         
         self.setLayout(layout)
     
+    def showEvent(self, event):
+        """Catch up on plot updates made while the widget was hidden"""
+        super().showEvent(event)
+        self.plotter.flush_pending_draw()
+    
     def update_plots(self, results: SimulationResults):
         """Update plots with new results"""
-        self.plotter.plot_results(results)
+        if self.plotter.is_primed:
+            self.plotter.update_results(results)
+        else:
+            self.plotter.plot_results(results)
         self.current_results = results
     
     def clear_plots(self):
@@ -56,34 +67,26 @@ class PlotWidget(QWidget):
         self.plotter.clear_plots()
         self.current_results = None
     
-    def export_plots(self):
+    def export_plots(self, dpi: int = 150):
         """
         Export plots to file with progress indication
+        
+        PNG is offered first; PDF/SVG exports rasterize the dense plot layers.
         """
-        try:
-            filename, _ = QFileDialog.getSaveFileName(
-                self, "Export Plots", "", "PNG Files (*.png);;All Files (*)"
-            )
-            if filename:
-                QApplication.setOverrideCursor(Qt.WaitCursor)
-                self.plotter.export_plots(filename)
-                QApplication.restoreOverrideCursor()
-                QMessageBox.information(self, "Success", "Plots exported successfully!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to export plots: {str(e)}")
-        """Export plots to file"""
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Plots", "", 
             "PNG Files (*.png);;PDF Files (*.pdf);;SVG Files (*.svg);;All Files (*)"
         )
         
         if filename:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
-                self.plotter.export_plots(filename)
-                from ..dialogs.error_dialog import ErrorDialog
-                ErrorDialog.show_info(self, "Export Success", 
-                                    f"Plots exported successfully to {filename}")
+                self.plotter.export_plots(filename, dpi=dpi)
             except Exception as e:
-                from ..dialogs.error_dialog import ErrorDialog
+                QApplication.restoreOverrideCursor()
                 ErrorDialog.show_error(self, "Export Error", 
                                      f"Failed to export plots: {str(e)}")
+                return
+            QApplication.restoreOverrideCursor()
+            ErrorDialog.show_info(self, "Export Success", 
+                                f"Plots exported successfully to {filename}")
@@ -1,11 +1,117 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView,
                              QPushButton, QHBoxLayout, QHeaderView, QComboBox,
                              QSpinBox, QDoubleSpinBox, QItemDelegate, QGroupBox,
                              QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
+from contextlib import contextmanager
+from dataclasses import replace
 from typing import List
 from ...models.silo import Silo
 
+# Materials listed in a new MaterialTable
+_DEFAULT_MATERIALS = ("Lump Ore", "Sinter", "Pellet", "Dolomite", "Limestone", "Nut Coke", "Quartz")
+
+# Silo attribute and type shown in each silo table column
+_SILO_COLUMNS = (
+    ('material', str),
+    ('capacity', float),
+    ('flow_rate', float),
+    ('material_position', int),
+    ('silo_position', int),
+    ('start_time', float),
+)
+_SILO_HEADERS = ['Material', 'Capacity [kg]', 'Flow [kg/s]', 
+                 'Material Position', 'Silo Position', 'Start Time [s]']
+
+# Row added by "Add Silo". Shared between rows: the model never mutates
+# silos in place (edits go through dataclasses.replace).
+_DEFAULT_SILO = Silo(
+    material='',
+    capacity=1000.0,
+    flow_rate=5.0,
+    material_position=0,
+    silo_position=0,
+    start_time=0.0
+)
+
+@contextmanager
+def _updates_suspended(view):
+    """Hold off repainting (and re-sorting) a view while its model is bulk-loaded"""
+    header = view.horizontalHeader()
+    was_sorting = view.isSortingEnabled()
+    indicator_shown = header.isSortIndicatorShown()
+    view.setSortingEnabled(False)
+    header.setSortIndicatorShown(False)
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        # Re-enabling sorting sorts once, after all rows are in
+        header.setSortIndicatorShown(indicator_shown)
+        view.setSortingEnabled(was_sorting)
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+class MaterialTableModel(QAbstractTableModel):
+    """Table model holding material names directly as a list of strings"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._materials: List[str] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._materials)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._materials[index.row()]
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._materials[index.row()] = str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return 'Material Name'
+        return section + 1
+    
+    def materials(self) -> List[str]:
+        """Return a copy of the stored material names"""
+        return list(self._materials)
+    
+    def set_materials(self, materials: List[str]):
+        """Replace all materials in a single model reset"""
+        self.beginResetModel()
+        self._materials = [str(m) for m in materials]
+        self.endResetModel()
+    
+    def append_material(self, name: str):
+        """Append a material row"""
+        row = len(self._materials)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._materials.append(name)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """Remove a material row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._materials[row]
+        self.endRemoveRows()
+
 class MaterialTable(QWidget):
     """Widget for managing materials"""
     
@@ -15,9 +121,8 @@ class MaterialTable(QWidget):
         super().__init__()
         self.setup_ui()
         
-        # Default materials
-        self.default_materials = ["Lump Ore", "Sinter", "Pellet", "Dolomite", "Limestone","Nut Coke", "Quartz"]
-        self.set_materials(self.default_materials)
+        # Nothing is connected yet, so the initial fill does not emit
+        self.set_materials(_DEFAULT_MATERIALS, emit=False)
     
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -27,9 +132,9 @@ class MaterialTable(QWidget):
         group_layout = QVBoxLayout()
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(1)
-        self.table.setHorizontalHeaderLabels(['Material Name'])
+        self.model = MaterialTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         group_layout.addWidget(self.table)
         
@@ -52,41 +157,30 @@ class MaterialTable(QWidget):
     
     def add_material(self):
         """Add a new material row"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        item = QTableWidgetItem(f"Material_{row+1}")
-        self.table.setItem(row, 0, item)
+        self.model.append_material(f"Material_{self.model.rowCount()+1}")
         self.emit_materials_changed()
     
     def remove_material(self):
         """Remove selected material"""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row >= 0:
-            self.table.removeRow(current_row)
+            self.model.remove_row(current_row)
             self.emit_materials_changed()
     
     def get_materials(self) -> List[str]:
         """Get list of material names"""
-        materials = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.text().strip():
-                materials.append(item.text().strip())
-        return materials
+        return [name.strip() for name in self.model.materials() if name.strip()]
     
-    def set_materials(self, materials: List[str]):
+    def set_materials(self, materials: List[str], emit: bool = True):
         """Set material list"""
-        self.table.setRowCount(0)
-        for material in materials:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            item = QTableWidgetItem(material)
-            self.table.setItem(row, 0, item)
-        self.emit_materials_changed()
+        with _updates_suspended(self.table):
+            self.model.set_materials(materials)
+        if emit:
+            self.emit_materials_changed()
     
     def clear(self):
         """Clear all materials"""
-        self.table.setRowCount(0)
+        self.model.set_materials([])
         self.emit_materials_changed()
     
     def emit_materials_changed(self):
@@ -96,46 +190,62 @@ class MaterialTable(QWidget):
 class SiloTableDelegate(QItemDelegate):
     """Custom delegate for silo table editing"""
     
+    # (minimum, maximum, suffix, decimals) for the floating point columns
+    CAPACITY_SPIN = (1.0, 999999.0, " kg", 2)
+    FLOW_RATE_SPIN = (0.01, 1000.0, " kg/s", 3)
+    START_TIME_SPIN = (0.0, 86400.0, " s", 1)
+    
     def __init__(self, materials=None):
         super().__init__()
         self.materials = materials or []
+        self._factories = {
+            0: self._make_material_combo,
+            1: self._make_capacity_spin,
+            2: self._make_flow_rate_spin,
+            3: self._make_material_position_spin,
+            4: self._make_silo_position_spin,
+            5: self._make_start_time_spin
+        }
     
     def createEditor(self, parent, option, index):
-        column = index.column()
-        
-        if column == 0:  # Material dropdown
-            combo = QComboBox(parent)
-            combo.addItems(self.materials)
-            return combo
-        elif column == 1:  # Capacity
-            spinbox = QDoubleSpinBox(parent)
-            spinbox.setRange(1.0, 999999.0)
-            spinbox.setSuffix(" kg")
-            spinbox.setDecimals(2)
-            return spinbox
-        elif column == 2:  # Flow rate
-            spinbox = QDoubleSpinBox(parent)
-            spinbox.setRange(0.01, 1000.0)
-            spinbox.setSuffix(" kg/s")
-            spinbox.setDecimals(3)
-            return spinbox
-        elif column == 3:  # Material position
-            spinbox = QSpinBox(parent)
-            spinbox.setRange(0, max(len(self.materials)-1, 0))
-            return spinbox
-        elif column == 4:  # Silo position
-            spinbox = QSpinBox(parent)
-            spinbox.setRange(0, 1000)
-            return spinbox
-        elif column == 5:  # Start time
-            spinbox = QDoubleSpinBox(parent)
-            spinbox.setRange(0.0, 86400.0)
-            spinbox.setSuffix(" s")
-            spinbox.setDecimals(1)
-            return spinbox
-        
+        factory = self._factories.get(index.column())
+        if factory:
+            return factory(parent)
         return super().createEditor(parent, option, index)
     
+    @staticmethod
+    def _make_double_spin(parent, spec):
+        minimum, maximum, suffix, decimals = spec
+        spinbox = QDoubleSpinBox(parent)
+        spinbox.setRange(minimum, maximum)
+        spinbox.setSuffix(suffix)
+        spinbox.setDecimals(decimals)
+        return spinbox
+    
+    def _make_material_combo(self, parent):
+        combo = QComboBox(parent)
+        combo.addItems(self.materials)
+        return combo
+    
+    def _make_capacity_spin(self, parent):
+        return self._make_double_spin(parent, self.CAPACITY_SPIN)
+    
+    def _make_flow_rate_spin(self, parent):
+        return self._make_double_spin(parent, self.FLOW_RATE_SPIN)
+    
+    def _make_material_position_spin(self, parent):
+        spinbox = QSpinBox(parent)
+        spinbox.setRange(0, max(len(self.materials)-1, 0))
+        return spinbox
+    
+    def _make_silo_position_spin(self, parent):
+        spinbox = QSpinBox(parent)
+        spinbox.setRange(0, 1000)
+        return spinbox
+    
+    def _make_start_time_spin(self, parent):
+        return self._make_double_spin(parent, self.START_TIME_SPIN)
+    
     def setEditorData(self, editor, index):
         value = index.model().data(index, Qt.EditRole)
         
@@ -171,12 +281,88 @@ class SiloTableDelegate(QItemDelegate):
         """Update available materials"""
         self.materials = materials
 
+class SiloTableModel(QAbstractTableModel):
+    """Table model holding silo configurations directly as Silo objects"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._silos: List[Silo] = []
+        self._headers = list(_SILO_HEADERS)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._silos)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_SILO_COLUMNS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        attr, _ = _SILO_COLUMNS[index.column()]
+        value = getattr(self._silos[index.row()], attr)
+        return str(value) if role == Qt.DisplayRole else value
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        attr, cast = _SILO_COLUMNS[index.column()]
+        row = index.row()
+        try:
+            value = int(float(value)) if cast is int else cast(value)
+            # Replace rather than mutate so silos already handed out stay intact
+            self._silos[row] = replace(self._silos[row], **{attr: value})
+        except (ValueError, TypeError):
+            return False
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+    
+    def set_header_labels(self, labels: List[str]):
+        """Set the horizontal header labels"""
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+    
+    def silos(self) -> List[Silo]:
+        """Return a copy of the stored silo list"""
+        return list(self._silos)
+    
+    def set_silos(self, silos: List[Silo]):
+        """Replace all silos in a single model reset"""
+        self.beginResetModel()
+        self._silos = list(silos)
+        self.endResetModel()
+    
+    def append_silo(self, silo: Silo):
+        """Append a silo row"""
+        row = len(self._silos)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._silos.append(silo)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """Remove a silo row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._silos[row]
+        self.endRemoveRows()
+
 class SiloTable(QWidget):
     """Widget for managing silos"""
     
     def __init__(self):
         super().__init__()
         self.delegate = SiloTableDelegate()
+        self._silos_cache = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -187,15 +373,19 @@ class SiloTable(QWidget):
         group_layout = QVBoxLayout()
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        headers = ['Material', 'Capacity [kg]', 'Flow [kg/s]', 
-                  'Material Position', 'Silo Position', 'Start Time [s]']
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model = SiloTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setItemDelegate(self.delegate)
         group_layout.addWidget(self.table)
         
+        # Any model change invalidates the cached silo list
+        self.model.dataChanged.connect(self._invalidate_silos)
+        self.model.rowsInserted.connect(self._invalidate_silos)
+        self.model.rowsRemoved.connect(self._invalidate_silos)
+        self.model.modelReset.connect(self._invalidate_silos)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
@@ -213,85 +403,62 @@ class SiloTable(QWidget):
         
         self.setLayout(layout)
     
+    def set_header_labels(self, labels: List[str]):
+        """Set the column header labels"""
+        self.model.set_header_labels(labels)
+    
     def add_silo(self):
         """Add a new silo row"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # Default values
-        defaults = ['', '1000.0', '5.0', '0', '0', '0.0']
-        for col, value in enumerate(defaults):
-            item = QTableWidgetItem(value)
-            self.table.setItem(row, col, item)
+        self.model.append_silo(_DEFAULT_SILO)
     
     def remove_silo(self):
         """Remove selected silo"""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row >= 0:
-            self.table.removeRow(current_row)
+            self.model.remove_row(current_row)
+    
+    def _invalidate_silos(self, *args):
+        """Drop the cached silo list after the model changed"""
+        self._silos_cache = None
     
     def get_silos(self) -> List[Silo]:
         """Get list of configured silos"""
+        if self._silos_cache is None:
+            # Rows hold validated Silo objects; only rows without a material are skipped
+            self._silos_cache = [silo for silo in self.model.silos() if silo.material]
+        return list(self._silos_cache)
+    
+    def set_silos(self, silo_data: List[dict]):
+        """Set silo data from dictionary list"""
         silos = []
-        for row in range(self.table.rowCount()):
+        errors = []
+        for row, data in enumerate(silo_data):
+            # Rows without a material are dropped by get_silos anyway
+            material = str(data.get('material', '')).strip()
+            if not material:
+                continue
             try:
-                material = self.table.item(row, 0)
-                material = material.text() if material else ""
-                
-                capacity = self.table.item(row, 1)
-                capacity = float(capacity.text()) if capacity and capacity.text() else 0.0
-                
-                flow_rate = self.table.item(row, 2)
-                flow_rate = float(flow_rate.text()) if flow_rate and flow_rate.text() else 0.0
-                
-                mat_pos = self.table.item(row, 3)
-                mat_pos = int(mat_pos.text()) if mat_pos and mat_pos.text() else 0
-                
-                silo_pos = self.table.item(row, 4)
-                silo_pos = int(silo_pos.text()) if silo_pos and silo_pos.text() else 0
-                
-                start_time = self.table.item(row, 5)
-                start_time = float(start_time.text()) if start_time and start_time.text() else 0.0
-                
-                if material and capacity > 0 and flow_rate > 0:
-                    silo = Silo(
-                        material=material,
-                        capacity=capacity,
-                        flow_rate=flow_rate,
-                        material_position=mat_pos,
-                        silo_position=silo_pos,
-                        start_time=start_time
-                    )
-                    silos.append(silo)
+                silos.append(Silo(
+                    material=material,
+                    capacity=float(data.get('capacity', 0)),
+                    flow_rate=float(data.get('flow_rate', 0)),
+                    material_position=int(data.get('material_position', 0)),
+                    silo_position=int(data.get('silo_position', 0)),
+                    start_time=float(data.get('start_time', 0))
+                ))
             except (ValueError, TypeError) as e:
-                QMessageBox.warning(self, "Invalid Data", 
-                                  f"Row {row+1} has invalid data: {str(e)}")
+                errors.append(f"Row {row+1}: {str(e)}")
         
-        return silos
-    
-    def set_silos(self, silo_data: List[dict]):
-        """Set silo data from dictionary list"""
-        self.table.setRowCount(0)
-        for data in silo_data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            values = [
-                data.get('material', ''),
-                str(data.get('capacity', '0')),
-                str(data.get('flow_rate', '0')),
-                str(data.get('material_position', '0')),
-                str(data.get('silo_position', '0')),
-                str(data.get('start_time', '0'))
-            ]
-            
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                self.table.setItem(row, col, item)
+        if errors:
+            QMessageBox.warning(self, "Invalid Data", 
+                              "Some rows have invalid data and were skipped:\n" + "\n".join(errors))
+        
+        with _updates_suspended(self.table):
+            self.model.set_silos(silos)
     
     def clear(self):
         """Clear all silos"""
-        self.table.setRowCount(0)
+        self.model.set_silos([])
     
     def update_material_options(self, materials: List[str]):
         """Update available materials in dropdown"""
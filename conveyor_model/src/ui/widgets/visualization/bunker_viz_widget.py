@@ -6,24 +6,27 @@ from pathlib import Path
 module_path = str(Path(__file__).resolve().parents[3])  # Add project root to path
 sys.path.append(module_path)
 
+from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QMessageBox
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
 
-from src.visualization.bunker_visualizer import BunkerVisualizer
-from src.simulation.bf_bunker_viz import BlastFurnaceBunker
+if TYPE_CHECKING:
+    from src.simulation.bf_bunker_viz import BlastFurnaceBunker
+
+# Sub-plots of the bunker figure, in drawing order
+_SECTIONS = ('bunker', 'chemistry', 'timeline')
 
 class BunkerVisualizationWidget(QWidget):
     """Widget for embedding bunker visualization in Qt"""
     
-    def __init__(self, bunker: BlastFurnaceBunker, parent=None):
+    def __init__(self, bunker: 'BlastFurnaceBunker', parent=None):
         super().__init__(parent)
         self.bunker = bunker
         self.viz = None
         self.canvas = None
         self.toolbar = None
         self._layout = None  # Use different name to avoid conflict
+        self._dirty = dict.fromkeys(_SECTIONS, True)
+        self._signatures = {}  # Section -> bunker state it was last drawn from
         self.setup_ui()
         self.setup_visualization()
     
@@ -36,6 +39,12 @@ class BunkerVisualizationWidget(QWidget):
     def setup_visualization(self):
         """Set up bunker visualization"""
         try:
+            # matplotlib is imported here so importing the module stays cheap
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+            from src.visualization.bunker_visualizer import BunkerVisualizer
+            
             # Create figure and visualizer
             fig = Figure(figsize=(12, 8))
             self.viz = BunkerVisualizer(self.bunker, fig)
@@ -50,8 +59,9 @@ class BunkerVisualizationWidget(QWidget):
                 layout.addWidget(self.toolbar)
                 layout.addWidget(self.canvas)
             
-            # Initial plots
+            # Initial plots; lay out once so exports need no tight bbox pass
             self.update_plots()
+            self.viz.figure.tight_layout(pad=3.0)
             
         except Exception as e:
             QMessageBox.critical(self, "Visualization Error", 
@@ -63,22 +73,55 @@ class BunkerVisualizationWidget(QWidget):
             return
             
         try:
-            self.viz.plot_bunker()
-            self.viz.plot_chemistry()
-            self.viz.plot_timeline()
-            self.canvas.draw()
+            plotters = {
+                'bunker': self.viz.plot_bunker,
+                'chemistry': self.viz.plot_chemistry,
+                'timeline': self.viz.plot_timeline
+            }
+            signatures = self._section_signatures()
+            redrawn = False
+            
+            # Only re-run plotters whose data changed since they last ran
+            for section in _SECTIONS:
+                if self._dirty[section] or self._signatures.get(section) != signatures[section]:
+                    plotters[section]()
+                    self._signatures[section] = signatures[section]
+                    self._dirty[section] = False
+                    redrawn = True
+            
+            if redrawn:
+                self.canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Update Error",
                               f"Failed to update plots: {str(e)}")
     
+    def invalidate(self, section: str = None):
+        """Force a sub-plot (or all of them) to be re-plotted on next update"""
+        for name in (_SECTIONS if section is None else (section,)):
+            self._dirty[name] = True
+    
+    def _section_signatures(self) -> dict:
+        """Cheap fingerprints of the bunker state each sub-plot depends on"""
+        layers = self.bunker.layers
+        layers_sig = (id(layers), len(layers), id(layers[-1]) if layers else None)
+        return {
+            'bunker': (self.bunker.diameter, self.bunker.height, layers_sig),
+            'chemistry': layers_sig,
+            'timeline': layers_sig
+        }
+    
     def clear_plots(self):
         """Clear all plots"""
         if self.viz:
             self.viz.clear()
+            self.invalidate()
             if self.canvas:
-                self.canvas.draw()
+                self.canvas.draw_idle()
                 
     def save_figure(self, filename: str, dpi: int = 300):
         """Save current figure to file"""
         if self.viz and self.viz.figure:
-            self.viz.figure.savefig(filename, dpi=dpi, bbox_inches='tight')
\ No newline at end of file
+            if self.canvas:
+                # Apply any pending idle draw before exporting
+                self.canvas.flush_events()
+            self.viz.figure.savefig(filename, dpi=dpi)
\ No newline at end of file
@@ -1,14 +1,85 @@
 import json
 import os
-from typing import Dict, Any, Optional, Union
+import tempfile
+from typing import Dict, Any
 from .exceptions import ValidationError
 
+# orjson is optional; it parses and serializes straight from/to bytes
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2).encode('utf-8')
+
+_MISSING = object()
+
+_DEFAULT_MATERIALS = ("Lump Ore", "Sinter", "Pellet", "Nut Coke", "Limestone", "Quartz", "Dolomite")
+
+_REQUIRED_SECTIONS = ('simulation', 'ui', 'materials', 'validation')
+
+# (section.key, check, extra args) applied in order by validate_config
+_RULES = (
+    ('simulation.default_total_time', 'positive_float', ()),
+    ('simulation.default_conveyor_length', 'positive_float', ()),
+    ('simulation.default_resolution_size', 'positive_float', ()),
+    ('simulation.default_conveyor_velocity', 'positive_float', ()),
+    ('simulation.max_simulation_time', 'positive_float', ()),
+    ('ui.window_width', 'positive_int', (800,)),
+    ('ui.window_height', 'positive_int', (600,)),
+    ('ui.auto_save_interval', 'auto_save_interval', ()),
+    ('materials.default_materials', 'string_list', ()),
+    ('validation.min_capacity', 'positive_float', ()),
+    ('validation.max_capacity', 'positive_float', ()),
+    ('validation.min_flow_rate', 'positive_float', ()),
+    ('validation.max_flow_rate', 'positive_float', ()),
+)
+
+# (section, lower key, upper key) pairs where lower must stay below upper
+_RANGES = (
+    ('validation', 'min_capacity', 'max_capacity'),
+    ('validation', 'min_flow_rate', 'max_flow_rate'),
+)
+
+def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested config sections into dot-notation keys"""
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+def _deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> None:
+    """Recursively merge overlay into base, keeping base keys overlay omits"""
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+
 class ConfigManager:
     """Manages application configuration"""
     
     def __init__(self, config_file: str = "config/default_config.json"):
         self.config_file = config_file
+        self._last_valid_hash = None
         self.config = self.load_config()
+        self._flat = _flatten(self.config)
+        # Nothing to write until set() changes something (or no file exists yet)
+        self._dirty = not os.path.exists(self.config_file)
+        
+        try:
+            self.validate_config(self.config)
+        except ValidationError as e:
+            print(f"Warning: Invalid configuration: {e}")
     
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -23,52 +94,25 @@ class ConfigManager:
         Raises:
             ValidationError: If configuration is invalid
         """
-        try:
-            # Validate required sections
-            required_sections = ['simulation', 'ui', 'materials', 'validation']
-            for section in required_sections:
-                if section not in config:
-                    raise ValidationError(f"Missing required configuration section: {section}")
-            
-            # Validate simulation parameters
-            sim_config = config['simulation']
-            self._validate_positive_float(sim_config, 'default_total_time')
-            self._validate_positive_float(sim_config, 'default_conveyor_length')
-            self._validate_positive_float(sim_config, 'default_resolution_size')
-            self._validate_positive_float(sim_config, 'default_conveyor_velocity')
-            self._validate_positive_float(sim_config, 'max_simulation_time')
-            
-            # Validate UI parameters
-            ui_config = config['ui']
-            self._validate_positive_int(ui_config, 'window_width', min_value=800)
-            self._validate_positive_int(ui_config, 'window_height', min_value=600)
-            self._validate_auto_save_interval(ui_config.get('auto_save_interval', 300))
-            
-            # Validate materials
-            materials = config['materials'].get('default_materials', [])
-            if not isinstance(materials, list) or not all(isinstance(m, str) for m in materials):
-                raise ValidationError("default_materials must be a list of strings")
-                
-            # Validate validation parameters
-            val_config = config['validation']
-            self._validate_positive_float(val_config, 'min_capacity')
-            self._validate_positive_float(val_config, 'max_capacity')
-            self._validate_positive_float(val_config, 'min_flow_rate')
-            self._validate_positive_float(val_config, 'max_flow_rate')
-            
-            if val_config['min_capacity'] >= val_config['max_capacity']:
-                raise ValidationError("min_capacity must be less than max_capacity")
-            if val_config['min_flow_rate'] >= val_config['max_flow_rate']:
-                raise ValidationError("min_flow_rate must be less than max_flow_rate")
-            
+        # Identical content was already validated
+        config_hash = hash(json.dumps(config, sort_keys=True, default=repr))
+        if config_hash == self._last_valid_hash:
             return True
-            
-        except KeyError as e:
-            raise ValidationError(f"Missing required configuration key: {e}")
-        except TypeError as e:
-            raise ValidationError(f"Invalid configuration type: {e}")
-        except ValueError as e:
-            raise ValidationError(f"Invalid configuration value: {e}")
+        
+        for section in _REQUIRED_SECTIONS:
+            if not isinstance(config.get(section), dict):
+                raise ValidationError(f"Missing required configuration section: {section}")
+        
+        for path, check, args in _RULES:
+            section, key = path.split('.')
+            getattr(self, f'_validate_{check}')(config[section], key, *args)
+        
+        for section, lower, upper in _RANGES:
+            if config[section][lower] >= config[section][upper]:
+                raise ValidationError(f"{lower} must be less than {upper}")
+        
+        self._last_valid_hash = config_hash
+        return True
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -87,9 +131,7 @@ class ConfigManager:
                 "auto_save_interval": 300
             },
             "materials": {
-                "default_materials": [
-                    "Lump Ore", "Sinter", "Pellet", "Nut Coke", "Limestone", "Quartz", "Dolomite"
-                ]
+                "default_materials": list(_DEFAULT_MATERIALS)
             },
             "validation": {
                 "min_capacity": 1.0,
@@ -101,10 +143,10 @@ class ConfigManager:
         
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    loaded_config = _loads(f.read())
                 # Merge with defaults
-                default_config.update(loaded_config)
+                _deep_merge(default_config, loaded_config)
             except Exception as e:
                 print(f"Warning: Could not load config file: {e}")
         
@@ -112,15 +154,34 @@ class ConfigManager:
     
     def save_config(self):
         """Save current configuration to file"""
+        if not self._dirty:
+            return
+        
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            # Write a temporary file and swap it in so a crash never leaves a partial config
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(self.config_file) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dumps(self.config))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_file, 0o644)  # mkstemp files are owner-only
+                os.replace(tmp_file, self.config_file)
+            except BaseException:
+                os.remove(tmp_file)
+                raise
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
+        value = self._flat.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        # Section lookups (e.g. "simulation") are not in the flat index
         keys = key.split('.')
         value = self.config
         
@@ -148,8 +209,9 @@ class ConfigManager:
         if value < min_value:
             raise ValidationError(f"{key} must be at least {min_value}")
     
-    def _validate_auto_save_interval(self, value: int) -> None:
+    def _validate_auto_save_interval(self, config: Dict[str, Any], key: str) -> None:
         """Validate auto-save interval"""
+        value = config.get(key, 300)
         if not isinstance(value, int):
             raise ValidationError("auto_save_interval must be an integer")
         if value < 0:
@@ -157,6 +219,12 @@ class ConfigManager:
         if value > 3600:
             raise ValidationError("auto_save_interval must not exceed 3600 seconds")
     
+    def _validate_string_list(self, config: Dict[str, Any], key: str) -> None:
+        """Validate that a configuration value is a list of strings"""
+        value = config.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValidationError(f"{key} must be a list of strings")
+    
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
         keys = key.split('.')
@@ -167,4 +235,6 @@ class ConfigManager:
                 config_dict[k] = {}
             config_dict = config_dict[k]
         
-        config_dict[keys[-1]] = value
\ No newline at end of file
+        config_dict[keys[-1]] = value
+        self._flat = _flatten(self.config)
+        self._dirty = True
\ No newline at end of file
@@ -1,17 +1,143 @@
+import base64
+import functools
+import gzip
 import json
 import os
-from typing import Optional, Dict, Any
+import tempfile
+from typing import Optional, Dict, Any, Tuple
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 import numpy as np
 from .exceptions import FileHandlingError
 
+# orjson is optional; it is faster than json for the encode/decode itself.
+# numpy arrays go through _json_default so large ones get packed.
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+# msgpack is optional; .msgpack case files store arrays as raw bytes
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# pyarrow is optional; its C++ CSV writer is used for exports when present
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# msgpack extension type code for numpy arrays
+_MSGPACK_NDARRAY_EXT = 17
+
+# Arrays at least this large are stored as base64 instead of nested lists
+_ARRAY_INLINE_MAX_BYTES = 4096
+
+def _encode_ndarray(array: np.ndarray) -> Any:
+    """Encode an array as a list, or as a base64 envelope when large or non-finite"""
+    if array.dtype.kind not in 'biufc':
+        return array.tolist()
+    # NaN/Infinity keep their bit patterns in the envelope; orjson would write them as null
+    if array.nbytes < _ARRAY_INLINE_MAX_BYTES and (array.dtype.kind not in 'fc' or np.isfinite(array).all()):
+        return array.tolist()
+    
+    packed = array.dtype == np.bool_
+    raw = np.packbits(array) if packed else np.ascontiguousarray(array)
+    return {
+        '__ndarray__': True,
+        'dtype': array.dtype.str,
+        'shape': list(array.shape),
+        'packed': bool(packed),
+        'b64': base64.b64encode(raw.tobytes()).decode('ascii')
+    }
+
+def _decode_ndarray(envelope: Dict[str, Any]) -> np.ndarray:
+    """Rebuild an array from the envelope written by _encode_ndarray"""
+    raw = base64.b64decode(envelope['b64'])
+    shape = tuple(envelope['shape'])
+    if envelope.get('packed'):
+        count = int(np.prod(shape))
+        flat = np.unpackbits(np.frombuffer(raw, dtype=np.uint8), count=count).astype(bool)
+        return flat.reshape(shape)
+    return np.frombuffer(raw, dtype=np.dtype(envelope['dtype'])).reshape(shape).copy()
+
+def _json_default(obj: Any) -> Any:
+    """Convert values json/orjson cannot serialize natively"""
+    if isinstance(obj, np.ndarray):
+        return _encode_ndarray(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, complex):
+        return [obj.real, obj.imag]
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON; files holding NaN/Infinity tokens are left to the json module"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Not valid strict JSON; json accepts the NaN/Infinity extension
+    return json.loads(raw)
+
+def _msgpack_default(obj: Any) -> Any:
+    """Pack numpy values for msgpack; arrays become a raw-bytes extension"""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind not in 'biufc':
+            return obj.tolist()
+        header = [obj.dtype.str, list(obj.shape), np.ascontiguousarray(obj).tobytes()]
+        return msgpack.ExtType(_MSGPACK_NDARRAY_EXT, msgpack.packb(header, use_bin_type=True))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} cannot be packed")
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Rebuild numpy arrays packed by _msgpack_default"""
+    if code != _MSGPACK_NDARRAY_EXT:
+        return msgpack.ExtType(code, data)
+    dtype, shape, raw = msgpack.unpackb(data, raw=False)
+    return np.frombuffer(raw, dtype=np.dtype(dtype)).reshape(shape).copy()
+
+def _is_gzip_file(filename: str) -> bool:
+    return filename.lower().endswith('.gz')
+
+def _is_msgpack_file(filename: str) -> bool:
+    name = filename.lower()
+    return name.endswith('.msgpack') or name.endswith('.msgpack.gz')
+
+def _read_case_file(filename: str) -> Any:
+    """Read and parse a case file"""
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    if _is_gzip_file(filename):
+        raw = gzip.decompress(raw)
+    if _is_msgpack_file(filename):
+        if msgpack is None:
+            raise FileHandlingError("Reading .msgpack case files requires the msgpack package")
+        return msgpack.unpackb(raw, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+    return _loads_json(raw)
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(key: Tuple[str, int, int]) -> Any:
+    """Parse a case file; keyed on (path, mtime_ns, size) so edited files miss"""
+    return _read_case_file(key[0])
+
 class FileHandler:
     """Handles saving and loading of case files"""
     
-    def __init__(self):
+    def __init__(self, cache: bool = False):
+        self.cache = cache  # Reuse parsed case files that did not change on disk
         self.current_filename = None
         self.default_extension = ".json"
-        self.file_filter = "JSON Files (*.json);;All Files (*)"
+        self.file_filter = "JSON Files (*.json);;Compressed JSON Files (*.json.gz);;All Files (*)"
+        if msgpack is not None:
+            self.file_filter = ("JSON Files (*.json);;Compressed JSON Files (*.json.gz);;"
+                                "MessagePack Files (*.msgpack);;All Files (*)")
     
     def save_case(self, data: Dict[str, Any], filename: str = None) -> bool:
         """
@@ -34,13 +160,42 @@ class FileHandler:
             return self.save_case_as(data)
         
         try:
-            # Convert numpy arrays to lists for JSON serialization
-            serializable_data = self._make_json_serializable(data)
+            payload = None
+            if _is_msgpack_file(filename):
+                if msgpack is None:
+                    raise FileHandlingError("Saving .msgpack case files requires the msgpack package")
+                payload = msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+            elif orjson is not None:
+                payload = orjson.dumps(data, option=_ORJSON_OPTIONS, default=_json_default)
+                if b'null' in payload:
+                    # Either a None or a NaN/Infinity float that orjson wrote as null;
+                    # json below writes the latter as NaN/Infinity
+                    payload = None
+            if payload is None:
+                payload = json.dumps(data, indent=2, ensure_ascii=False,
+                                     default=_json_default).encode('utf-8')
+            
+            if _is_gzip_file(filename):
+                # Fastest level: close to copy speed, still shrinks numeric text several times
+                payload = gzip.compress(payload, compresslevel=1)
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, indent=2, ensure_ascii=False)
+            # Single write to a uniquely named temporary file swapped in afterwards,
+            # so a crash mid-save never destroys the previous case file and
+            # concurrent saves never share a temporary file
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(filename) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_file, 0o644)  # mkstemp files are owner-only
+                os.replace(tmp_file, filename)
+            except BaseException:
+                os.remove(tmp_file)
+                raise
             
             self.current_filename = filename
+            _load_cached.cache_clear()
             return True
             
         except Exception as e:
@@ -56,13 +211,18 @@ class FileHandler:
         Returns:
             True if successful, False if cancelled
         """
-        filename, _ = QFileDialog.getSaveFileName(
+        filename, selected_filter = QFileDialog.getSaveFileName(
             None, "Save Case", "", self.file_filter
         )
         
         if filename:
-            if not filename.endswith(self.default_extension):
-                filename += self.default_extension
+            if not filename.lower().endswith(('.json', '.msgpack', '.gz')):
+                if 'msgpack' in selected_filter:
+                    filename += '.msgpack'
+                elif 'json.gz' in selected_filter:
+                    filename += '.json.gz'
+                else:
+                    filename += self.default_extension
             
             return self.save_case(data, filename)
         
@@ -90,8 +250,14 @@ class FileHandler:
             return None
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self.cache:
+                stat = os.stat(filename)
+                data = _load_cached((os.path.abspath(filename), stat.st_mtime_ns, stat.st_size))
+            else:
+                data = _read_case_file(filename)
+            # Rebuilds every container and copies array leaves, so callers never
+            # share the cached data (.msgpack files parse straight to arrays)
+            data = self._restore_ndarrays(data)
             
             self.current_filename = filename
             return data
@@ -103,24 +269,21 @@ class FileHandler:
         except Exception as e:
             raise FileHandlingError(f"Failed to load file: {str(e)}")
     
-    def _make_json_serializable(self, data: Any) -> Any:
-        """Convert data to JSON-serializable format"""
-        if isinstance(data, np.ndarray):
-            return data.tolist()
-        elif isinstance(data, np.integer):
-            return int(data)
-        elif isinstance(data, np.floating):
-            return float(data)
-        elif isinstance(data, dict):
-            return {key: self._make_json_serializable(value) 
-                   for key, value in data.items()}
-        elif isinstance(data, (list, tuple)):
-            return [self._make_json_serializable(item) for item in data]
+    def _restore_ndarrays(self, data: Any) -> Any:
+        """Turn base64 array envelopes from a loaded case back into arrays (fresh copies)"""
+        if isinstance(data, dict):
+            if data.get('__ndarray__') is True:
+                return _decode_ndarray(data)
+            return {key: self._restore_ndarrays(value) for key, value in data.items()}
+        elif isinstance(data, list):
+            return [self._restore_ndarrays(item) for item in data]
+        elif isinstance(data, np.ndarray):
+            return data.copy()
         else:
             return data
     
-    def export_results_csv(self, results, filename: str = None) -> bool:
-        """Export simulation results to CSV"""
+    def export_results_csv(self, results, filename: str = None, chunk_size: int = 65536) -> bool:
+        """Export simulation results to CSV, writing chunk_size rows at a time"""
         if filename is None:
             filename, _ = QFileDialog.getSaveFileName(
                 None, "Export Results", "", "CSV Files (*.csv);;All Files (*)"
@@ -130,28 +293,45 @@ class FileHandler:
             return False
         
         try:
-            import pandas as pd
-            
-            # Create DataFrame with results
+            # Resolved once; both writers below only slice these
             time_array = results.get_time_array()
-            df_data = {}
-            
-            # Add time column
-            df_data['Time [s]'] = time_array
+            n_rows = len(time_array)
+            materials = results.parameters.materials
+            n_materials = len(materials)
+            flow_data = results.flow_data
+            proportion_data = results.proportion_data
             
-            # Add material flow columns
-            for i, material in enumerate(results.parameters.materials):
-                df_data[f'{material} Flow [kg/s]'] = results.flow_data[:len(time_array), i]
+            # Time, material flows, total flow, material proportions
+            columns = (['Time [s]'] 
+                       + [f'{material} Flow [kg/s]' for material in materials]
+                       + ['Total Flow [kg/s]']
+                       + [f'{material} Proportion [%]' for material in materials])
             
-            # Add total flow
-            df_data['Total Flow [kg/s]'] = results.flow_data[:len(time_array), -1]
+            if pa is not None:
+                arrays = ([time_array]
+                          + [flow_data[:n_rows, i] for i in range(n_materials)]
+                          + [flow_data[:n_rows, -1]]
+                          + [proportion_data[:n_rows, i] for i in range(n_materials)])
+                table = pa.Table.from_arrays([pa.array(a) for a in arrays], names=columns)
+                pa_csv.write_csv(table, filename,
+                                 write_options=pa_csv.WriteOptions(batch_size=chunk_size))
+                return True
             
-            # Add proportion columns
-            for i, material in enumerate(results.parameters.materials):
-                df_data[f'{material} Proportion [%]'] = results.proportion_data[:len(time_array), i]
+            import pandas as pd
             
-            df = pd.DataFrame(df_data)
-            df.to_csv(filename, index=False)
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                pd.DataFrame(columns=columns).to_csv(f, index=False)
+                
+                # Only one chunk of rows is held as a DataFrame at a time
+                for start in range(0, n_rows, chunk_size):
+                    stop = min(start + chunk_size, n_rows)
+                    block = np.column_stack([
+                        time_array[start:stop],
+                        flow_data[start:stop, :n_materials],
+                        flow_data[start:stop, -1],
+                        proportion_data[start:stop, :n_materials]
+                    ])
+                    pd.DataFrame(block, copy=False).to_csv(f, header=False, index=False)
             return True
             
         except ImportError:
@@ -162,22 +342,20 @@ class FileHandler:
                 
                 # Write header
                 header = ['Time [s]']
-                for material in results.parameters.materials:
+                for material in materials:
                     header.extend([f'{material} Flow [kg/s]', f'{material} Proportion [%]'])
                 header.append('Total Flow [kg/s]')
                 writer.writerow(header)
                 
-                # Write data
-                time_array = results.get_time_array()
-                for i in range(len(time_array)):
-                    row = [time_array[i]]
-                    for j in range(len(results.parameters.materials)):
-                        row.extend([
-                            results.flow_data[i, j],
-                            results.proportion_data[i, j]
-                        ])
-                    row.append(results.flow_data[i, -1])
-                    writer.writerow(row)
+                # Write data; flow and proportion columns interleave per material
+                for start in range(0, n_rows, chunk_size):
+                    stop = min(start + chunk_size, n_rows)
+                    block = np.empty((stop - start, 2 * n_materials + 2))
+                    block[:, 0] = time_array[start:stop]
+                    block[:, 1:-1:2] = flow_data[start:stop, :n_materials]
+                    block[:, 2:-1:2] = proportion_data[start:stop, :n_materials]
+                    block[:, -1] = flow_data[start:stop, -1]
+                    np.savetxt(f, block, delimiter=',', fmt='%.17g', newline='\r\n')
             
             return True
             
@@ -1,11 +1,32 @@
 """
 Logging configuration and utilities for the application
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
+# Background thread that writes queued log records to the real handlers,
+# and the root-logger handler that feeds its queue
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+def _stop_listener() -> None:
+    """Detach the queue handler, then flush and stop the background log writer"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        # Nothing drains the queue once the listener stops
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 def setup_logging(log_dir: str = "logs", level: str = "INFO") -> None:
     """
     Setup application-wide logging configuration
@@ -13,7 +34,11 @@ def setup_logging(log_dir: str = "logs", level: str = "INFO") -> None:
     Args:
         log_dir: Directory to store log files
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    
+    Loggers only put records on a queue; a QueueListener thread writes them
+    out, with file writes batched until 1024 records or an ERROR arrive.
     """
+    global _listener, _queue_handler
     # Create logs directory if it doesn't exist
     os.makedirs(log_dir, exist_ok=True)
     
@@ -26,19 +51,30 @@ def setup_logging(log_dir: str = "logs", level: str = "INFO") -> None:
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # Setup file handler
+    # Setup file handler, buffered so the file is written in batches
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
     
     # Setup console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     
+    # Replace the queue handler and listener left over from an earlier setup
+    _stop_listener()
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
     
     # Log initial message
     root_logger.info("Logging initialized")
@@ -53,4 +89,6 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
+
+atexit.register(_stop_listener)
\ No newline at end of file
@@ -10,6 +10,7 @@ class BaseVisualizer:
     def __init__(self, figure: Optional[Figure] = None):
         self._figure = figure
         self._axes = {}
+        self._dirty = False  # Redraw skipped while the canvas was hidden
     
     @property
     def figure(self) -> Optional[Figure]:
@@ -47,7 +48,19 @@ class BaseVisualizer:
     def update(self):
         """Update all plots"""
         if self._figure and hasattr(self._figure, 'canvas'):
-            self._figure.canvas.draw()
+            canvas = self._figure.canvas
+            if hasattr(canvas, 'isVisible') and not canvas.isVisible():
+                # Nothing to see; draw once the canvas is shown again
+                self._dirty = True
+                return
+            # Coalesced into the next paint rather than rendering immediately
+            canvas.draw_idle()
+    
+    def flush_pending_draw(self):
+        """Draw an update that was skipped while the canvas was hidden"""
+        if self._dirty:
+            self._dirty = False
+            self.update()
     
     def export(self, filename: str, dpi: int = 300):
         """Export figure to file"""
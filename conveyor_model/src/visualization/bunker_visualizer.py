@@ -24,6 +24,8 @@ class BunkerVisualizer(BaseVisualizer):
         """
         super().__init__(figure)
         self.bunker = bunker
+        self._soa_key = None
+        self._soa = {}
         self._init_plot()
     
     def _init_plot(self, figsize: tuple = (12, 8)) -> None:
@@ -48,6 +50,51 @@ class BunkerVisualizer(BaseVisualizer):
         
         self.figure.tight_layout(pad=3.0)
     
+    def _layers_soa(self) -> Dict[str, np.ndarray]:
+        """Per-layer values as arrays, rebuilt only when the layer list changed
+        
+        Returns:
+            Dict[str, np.ndarray]: position, height, fe, b2, b4, volume,
+            timestamp and name arrays, one entry per layer
+        """
+        layers = self.bunker.layers
+        key = (id(layers), len(layers), id(layers[-1]) if layers else None)
+        if key == self._soa_key:
+            return self._soa
+        
+        n = len(layers)
+        columns = ('position', 'height', 'volume', 'timestamp', 'fe', 'sio2', 'cao', 'mgo', 'al2o3')
+        data = {name: np.empty(n) for name in columns}
+        names = np.empty(n, dtype=object)
+        
+        # Single pass over the layers
+        for i, layer in enumerate(layers):
+            data['position'][i] = layer.position
+            data['height'][i] = layer.height
+            data['volume'][i] = layer.volume
+            data['timestamp'][i] = layer.timestamp
+            data['fe'][i] = layer.fe_content
+            data['sio2'][i] = layer.sio2_content
+            data['cao'][i] = layer.cao_content
+            data['mgo'][i] = layer.mgo_content
+            data['al2o3'][i] = layer.al2o3_content
+            names[i] = layer.material_name
+        
+        # Basicities as in MaterialLayer.basicity_b2/b4, zero without acid oxides
+        acidic = data['sio2'] + data['al2o3']
+        self._soa = {
+            'position': data['position'],
+            'height': data['height'],
+            'fe': data['fe'],
+            'b2': np.divide(data['cao'], data['sio2'], out=np.zeros(n), where=data['sio2'] > 0),
+            'b4': np.divide(data['cao'] + data['mgo'], acidic, out=np.zeros(n), where=acidic > 0),
+            'volume': data['volume'],
+            'timestamp': data['timestamp'],
+            'name': names
+        }
+        self._soa_key = key
+        return self._soa
+    
     def plot_bunker(self):
         """Draw the current state of the bunker"""
         if not self.figure or 'bunker' not in self._axes:
@@ -95,15 +142,13 @@ class BunkerVisualizer(BaseVisualizer):
             return
             
         # Prepare data
-        heights = [layer.position + layer.height/2 for layer in self.bunker.layers]
-        fe_content = [layer.fe_content for layer in self.bunker.layers]
-        b2 = [layer.basicity_b2 for layer in self.bunker.layers]
-        b4 = [layer.basicity_b4 for layer in self.bunker.layers]
+        soa = self._layers_soa()
+        heights = soa['position'] + soa['height'] / 2
         
         # Plot profiles
-        ax.plot(fe_content, heights, 'b-', label='Fe%')
-        ax.plot(b2, heights, 'r-', label='B2')
-        ax.plot(b4, heights, 'g-', label='B4')
+        ax.plot(soa['fe'], heights, 'b-', label='Fe%')
+        ax.plot(soa['b2'], heights, 'r-', label='B2')
+        ax.plot(soa['b4'], heights, 'g-', label='B4')
         
         ax.set_title('Chemical Profile')
         ax.set_xlabel('Content %')
@@ -126,27 +171,28 @@ class BunkerVisualizer(BaseVisualizer):
                    transform=ax.transAxes)
             return
             
-        # Convert timestamps to datetime and normalize
-        base_time = min(layer.timestamp for layer in self.bunker.layers)
-        times = [(layer.timestamp - base_time)/3600 for layer in self.bunker.layers]
+        # Normalize timestamps to hours since the first addition
+        soa = self._layers_soa()
+        times = (soa['timestamp'] - soa['timestamp'].min()) / 3600
+        names = soa['name']
+        
+        # Group layer indices by material in one pass (materials sorted by name)
+        materials, inverse = np.unique(names, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        groups = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
         
         # Plot material additions
-        materials = list(set(layer.material_name for layer in self.bunker.layers))
-        for i, material in enumerate(materials):
-            material_times = [t for t, layer in zip(times, self.bunker.layers)
-                           if layer.material_name == material]
-            material_volumes = [layer.volume for layer in self.bunker.layers 
-                             if layer.material_name == material]
-            
-            ax.scatter(material_times, [i]*len(material_times),
-                      s=np.array(material_volumes)*50, # Scale marker size with volume
-                      alpha=0.6,
-                      label=material)
+        for i, (material, idx) in enumerate(zip(materials, groups)):
+            markers = ax.scatter(times[idx], np.full(len(idx), i),
+                                 s=soa['volume'][idx]*50, # Scale marker size with volume
+                                 alpha=0.6,
+                                 label=material)
+            markers.set_rasterized(True)
             
         ax.set_title('Material Addition Timeline')
         ax.set_xlabel('Time (hours)')
         ax.set_yticks(range(len(materials)))
-        ax.set_yticklabels(materials)
+        ax.set_yticklabels(list(materials))
         ax.grid(True)
         
     def update(self):
@@ -1,56 +1,216 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from matplotlib.collections import Collection, LineCollection, PolyCollection
+from matplotlib.image import AxesImage
+from matplotlib.patches import Patch
+from matplotlib.text import Text
 import numpy as np
 from typing import List, Optional, Dict, Any, Tuple
 from ..models.simulation_data import SimulationResults
-from ..models.material import Material
 from ..models.silo import Silo
 
 from .base_visualizer import BaseVisualizer
 
+_prep_pool: Optional[ThreadPoolExecutor] = None
+
+def _get_prep_pool() -> ThreadPoolExecutor:
+    """Shared worker threads for NumPy-bound plot data preparation (created on first use)"""
+    global _prep_pool
+    if _prep_pool is None:
+        _prep_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='plot-prep')
+    return _prep_pool
+
 class ConveyorPlotter(BaseVisualizer):
     """Handles all plotting functionality for conveyor simulation"""
     
-    def __init__(self, figure: Optional[Figure] = None):
+    # (row, col): (xlabel, ylabel, title, grid axis); applied once in setup_subplots
+    _AXES_DECOR = {
+        (0, 0): ('Time (s)', 'Flow Rate (kg/s)', 'Material Flow Rates', 'both'),
+        (1, 0): ('Time (s)', 'Proportion (%)', 'Material Composition', 'both'),
+        (0, 1): ('Time (s)', 'Total Flow Rate (kg/s)', 'Total Belt Flow Rate', 'both'),
+        (1, 1): ('Time (s)', 'Silo Number', 'Operation Schedule', 'x'),
+    }
+    
+    # Series longer than this many points per pixel column are downsampled before drawing
+    DOWNSAMPLE_FACTOR = 4
+    # Total samples above which the per-column downsampling runs on worker threads
+    PARALLEL_PREP_MIN_SAMPLES = 200_000
+    
+    def __init__(self, figure: Optional[Figure] = None, headless: bool = False):
+        """
+        Args:
+            figure (Optional[Figure]): Figure to draw into
+            headless (bool): Without a figure, create one on an off-screen
+                Agg canvas (for batch exports; no Qt widget involved)
+        """
+        if figure is None and headless:
+            figure = Figure(figsize=(12, 8))
+            FigureCanvasAgg(figure)
         super().__init__(figure)
         self._axes_grid = np.array([[None]])  # Default empty grid
+        self._stack_cache: Dict[bytes, List[np.ndarray]] = {}  # Data digest -> band polygons
+        self._forget_artists()
         self.setup_subplots()
     
     def setup_subplots(self):
-        """Initialize subplot layout"""
+        """Initialize subplot layout (once; existing axes are kept)"""
         if self.figure:
+            if self._axes_grid[0, 0] is not None and self._axes_grid[0, 0] in self.figure.axes:
+                return
             self.figure.clear()
-            axes_array = self.figure.subplots(2, 2)
-            if isinstance(axes_array, np.ndarray):
-                self._axes_grid = axes_array.reshape(2, 2)  # Store as ndarray
-            else:
-                self._axes_grid = np.array([[axes_array]])  # Single subplot case
-            self.figure.tight_layout(pad=3.0)
+            # Laid out by the constrained engine at draw time (and again on resize) instead of a tight_layout pass here
+            if hasattr(self.figure, 'set_layout_engine'):
+                self.figure.set_layout_engine('constrained')
+            else:  # matplotlib < 3.6
+                self.figure.set_constrained_layout(True)
+            self._axes_grid = self.figure.subplots(2, 2, squeeze=False)  # Always a 2x2 ndarray
+            
+            # Constant decorations are set here only; redraws remove data artists, not these
+            for (row, col), (xlabel, ylabel, title, grid_axis) in self._AXES_DECOR.items():
+                ax = self._axes_grid[row, col]
+                ax.set_xlabel(xlabel, fontsize=10)
+                ax.set_ylabel(ylabel, fontsize=10)
+                ax.set_title(title, fontsize=11)
+                ax.tick_params(labelsize=9)
+                ax.grid(True, alpha=0.3, axis=grid_axis)
+    
+    @staticmethod
+    def _clear_axes(ax: Axes, keep_legend: bool = False):
+        """
+        Remove the plotted data from an axes, keeping its labels, title and grid
+        
+        With keep_legend the legend stays too, for _sync_legend to reuse.
+        """
+        for artist in (*ax.lines, *ax.collections, *ax.patches, *ax.texts):
+            artist.remove()
+        legend = ax.get_legend()
+        if legend is not None and not keep_legend:
+            legend.remove()
+        ax.set_prop_cycle(None)  # Restart colours as ax.clear() did
+        ax.ignore_existing_data_limits = True
+        ax.set_autoscale_on(True)
+    
+    @staticmethod
+    def _sync_legend(ax: Axes, handles: List[Any]):
+        """
+        Show a legend for the handles, reusing the axes' current one when possible
+        
+        A legend with the same number of entries keeps its layout and only has
+        changed label texts replaced (entry colours follow the entry index);
+        otherwise it is rebuilt, or removed when there is nothing to show.
+        """
+        legend = ax.get_legend()
+        labels = [handle.get_label() for handle in handles]
+        if legend is not None and len(legend.get_texts()) == len(labels) and labels:
+            for text, label in zip(legend.get_texts(), labels):
+                if text.get_text() != label:
+                    text.set_text(label)
+            return
+        
+        if legend is not None:
+            legend.remove()
+        if handles:
+            ax.legend(handles=handles, fontsize=8, loc='upper left', ncol=1)
     
     @property
     def axes_grid(self) -> np.ndarray:
         """Get axes grid array"""
         return self._axes_grid
     
+    def _forget_artists(self):
+        """Drop handles to artists that were removed from the axes"""
+        self._flow_lc: Optional[LineCollection] = None
+        self._total_line: Optional[Line2D] = None
+        self._stack_poly: Optional[PolyCollection] = None
+        self._silo_bars: Optional[PolyCollection] = None
+        self._silo_labels: List[Text] = []
+        self._plotted_materials: Optional[Tuple[str, ...]] = None
+        self._plotted_silos: Optional[List[Silo]] = None
+        self._plot_shape: Optional[Tuple[int, int]] = None
+        self._last_signature: Optional[Tuple] = None
+    
+    @property
+    def is_primed(self) -> bool:
+        """Whether plot_results has drawn artists that update_results can reuse"""
+        return self._plotted_materials is not None
+    
     def plot_results(self, results: SimulationResults):
         """
         Plot all simulation results
         
+        Results with the same number of time steps and data columns as the
+        plotted ones are drawn by updating the existing artists in place;
+        anything else rebuilds the plots.
+        
         Args:
             results (SimulationResults): The simulation results to plot
         """
-        if self.figure is None:
+        if self.figure is None or self._is_plotted(results):
             return
-            
-        self.setup_subplots()  # Ensure we have axes setup
+        
+        if self.is_primed and self._plot_shape == self._results_shape(results):
+            self.update_results(results)
+        else:
+            self._replot(results)
+    
+    @staticmethod
+    def _results_signature(results: SimulationResults) -> Tuple:
+        """
+        The results, their flow buffer and its layout; cheap, no data is hashed
+        
+        The objects themselves are held (not their ids or addresses), so they
+        stay alive and a later run can never reuse their identity.
+        """
+        flow_data = results.flow_data
+        return (results, flow_data, flow_data.shape, flow_data.strides,
+                len(results.parameters.silos))
+    
+    def _is_plotted(self, results: SimulationResults) -> bool:
+        """
+        Whether these results are already on screen
+        
+        Assumes callers hand over new arrays rather than mutating plotted ones.
+        """
+        last = self._last_signature
+        if not self.is_primed or last is None:
+            return False
+        current = self._results_signature(results)
+        return last[0] is current[0] and last[1] is current[1] and last[2:] == current[2:]
+    
+    @staticmethod
+    def _plot_views(results: SimulationResults, t_len: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flow and proportion data trimmed to the time steps, as float64
+        
+        matplotlib transforms and rasterizes paths in double precision, so
+        float64 input is passed through as a view while any other dtype is
+        converted once here rather than by every artist that touches it.
+        """
+        return (results.flow_data[:t_len].astype(np.float64, copy=False),
+                results.proportion_data[:t_len].astype(np.float64, copy=False))
+    
+    @staticmethod
+    def _results_shape(results: SimulationResults) -> Tuple[int, int]:
+        """(time steps, flow columns) of the results, used to decide between update and rebuild"""
+        flow_data = results.flow_data
+        return len(results.get_time_array()), flow_data.shape[1] if flow_data.ndim == 2 else 0
+    
+    def _replot(self, results: SimulationResults):
+        """Rebuild every plot from scratch"""
+        self.setup_subplots()  # Ensure we have axes setup; existing ones are reused
+        self._forget_artists()
         
         # Clear previous plots
         for ax_row in self.axes_grid:
             for ax in ax_row:
                 if ax is not None:
-                    ax.clear()
+                    self._clear_axes(ax, keep_legend=True)
         
         time_array = results.get_time_array()
         materials = results.parameters.materials
@@ -61,88 +221,323 @@ class ConveyorPlotter(BaseVisualizer):
         total_ax = self.axes_grid[0, 1]
         silo_ax = self.axes_grid[1, 1]
         
-        # Create Material objects from material names
-        material_objects = [
-            Material(name=material_name, density=1.0)  # Default density, as it's not used in plotting
-            for material_name in materials
-        ]
+        # Computed once and shared by the helpers; the slices are views, not copies
+        t_len, t_max = self._time_extent(time_array)
+        flow_view, prop_view = self._plot_views(results, t_len)
+        time_array, flow_view, prop_view = self._downsample(flows_ax, time_array, flow_view, prop_view)
         
         if flows_ax is not None:
-            self._plot_material_flows(flows_ax, time_array, results.flow_data, material_objects)
+            self._plot_material_flows(flows_ax, time_array, flow_view, materials, t_max)
         
         if props_ax is not None:
-            self._plot_material_proportions(props_ax, time_array, results.proportion_data, material_objects)
+            self._plot_material_proportions(props_ax, time_array, prop_view, materials, t_max)
         
         if total_ax is not None:
-            self._plot_total_flow(total_ax, time_array, results.flow_data)
+            self._plot_total_flow(total_ax, time_array, flow_view, t_max)
         
         if silo_ax is not None:
             self._plot_silo_timeline(silo_ax, results.parameters.silos)
         
+        self._plotted_materials = tuple(materials)
+        self._plotted_silos = list(results.parameters.silos)
+        self._plot_shape = self._results_shape(results)
+        self._last_signature = self._results_signature(results)
         self.update()  # Use base class method to update
+    
+    def update_results(self, results: SimulationResults):
+        """
+        Update the plots for new results, reusing the existing line artists
+        
+        Flow lines are updated in place with set_data and the stacked
+        proportion areas with set_verts; the silo timeline is only redrawn
+        when the silos changed. Rebuilds the plots when the plotted material
+        set differs.
+        
+        Args:
+            results (SimulationResults): The simulation results to plot
+        """
+        if self.figure is None or self._is_plotted(results):
+            return
+        
+        materials = tuple(results.parameters.materials)
+        flow_data = results.flow_data
+        flow_count = self._flow_count(materials, flow_data)
+        if (materials != self._plotted_materials or self._total_line is None
+                or len(self._flow_lc.get_segments() if self._flow_lc is not None else ()) != flow_count):
+            self._replot(results)
+            return
+        
+        time_array = results.get_time_array()
+        t_len, t_max = self._time_extent(time_array)
+        flow_view, prop_view = self._plot_views(results, t_len)
+        flows_ax = self.axes_grid[0, 0]
+        props_ax = self.axes_grid[1, 0]
+        total_ax = self.axes_grid[0, 1]
+        silo_ax = self.axes_grid[1, 1]
+        time_array, flow_view, prop_view = self._downsample(flows_ax, time_array, flow_view, prop_view)
+        
+        if self._flow_lc is not None:
+            segments = self._flow_segments(time_array, flow_view, flow_count)
+            self._flow_lc.set_segments(segments)
+            # relim() ignores collections, so rebuild the data limits from the segments
+            flows_ax.ignore_existing_data_limits = True
+            flows_ax.update_datalim(segments.reshape(-1, 2))
+            flows_ax.autoscale_view()
+            flows_ax.set_xlim(0, t_max)
+        
+        self._total_line.set_data(time_array, flow_view[:, -1])
+        total_ax.relim()
+        total_ax.autoscale_view()
+        total_ax.set_xlim(0, t_max)
+        
+        stack_count = min(len(materials), prop_view.shape[1]) if prop_view.ndim == 2 else 0
+        if (self._stack_poly is not None and len(self._stack_poly.get_paths()) == stack_count
+                and t_len > 0):
+            self._stack_poly.set_verts(self._stack_verts(time_array, prop_view[:, :stack_count]))
+            props_ax.set_xlim(0, t_max)
+        else:
+            self._clear_axes(props_ax, keep_legend=True)
+            self._plot_material_proportions(props_ax, time_array, prop_view, materials, t_max)
+        
+        silos = list(results.parameters.silos)
+        if silos != self._plotted_silos and not self._update_silo_timeline(silo_ax, silos):
+            self._clear_axes(silo_ax)
+            self._silo_bars = None
+            self._silo_labels = []
+            self._plot_silo_timeline(silo_ax, silos)
+            self._plotted_silos = silos
+        
+        self._plot_shape = self._results_shape(results)
+        self._last_signature = self._results_signature(results)
+        self.update()
 
-    def _plot_material_flows(self, ax: Axes, time_array: np.ndarray, flow_data: np.ndarray, materials: List[Material]):
-        """Plot individual material flows"""
-        for i, material in enumerate(materials):
-            if i < flow_data.shape[1] - 2:  # Exclude time and total columns
-                ax.plot(time_array, flow_data[:len(time_array), i], 
-                       label=material.name, linewidth=2)
-        
-        ax.set_xlabel('Time (s)', fontsize=10)
-        ax.set_ylabel('Flow Rate (kg/s)', fontsize=10)
-        ax.set_title('Material Flow Rates', fontsize=11)
-        ax.legend(fontsize=8, loc='upper left', ncol=1)
-        ax.tick_params(labelsize=9)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, max(time_array) if len(time_array) > 0 else 100)
-    
-    def _plot_material_proportions(self, ax: Axes, time_array: np.ndarray, proportion_data: np.ndarray, materials: List[Material]):
+    def _downsample(self, ax: Optional[Axes], time_array: np.ndarray, flow_view: np.ndarray,
+                    prop_view: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Thin long series to about one point per pixel column of the axes
+        
+        Every flow and proportion column is reduced with LTTB and the union of
+        the kept indices is applied to all of them, so the series keep sharing
+        one time axis (which the stacked areas need). Series shorter than four
+        points per pixel are returned unchanged.
+        """
+        t_len = time_array.shape[0]
+        width = int(ax.bbox.width) if ax is not None else 0
+        if width < 3 or t_len <= self.DOWNSAMPLE_FACTOR * width:
+            return time_array, flow_view, prop_view
+        
+        # Only arrays covering every time step can be thinned alongside the time axis
+        blocks = [view.ndim == 2 and view.shape[0] == t_len for view in (flow_view, prop_view)]
+        columns = [view[:, j] for view, usable in zip((flow_view, prop_view), blocks) if usable
+                   for j in range(view.shape[1])]
+        if not columns:
+            return time_array, flow_view, prop_view
+        
+        if len(columns) > 1 and len(columns) * t_len >= self.PARALLEL_PREP_MIN_SAMPLES:
+            # Columns are independent and NumPy drops the GIL in the heavy ops; artists stay on this thread
+            picks = list(_get_prep_pool().map(
+                lambda column: self._lttb_indices(time_array, column, width), columns))
+        else:
+            picks = [self._lttb_indices(time_array, column, width) for column in columns]
+        
+        keep = np.unique(np.concatenate(picks))
+        return (time_array[keep],
+                flow_view[keep] if blocks[0] else flow_view,
+                prop_view[keep] if blocks[1] else prop_view)
+    
+    @staticmethod
+    def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """
+        Indices of the points kept by largest-triangle-three-buckets downsampling
+        
+        The interior points are split into n_out - 2 buckets and each bucket
+        keeps the point forming the largest triangle with the means of its
+        neighbouring buckets (the mean stands in for the previously selected
+        point so all buckets are scored in one vectorised pass). The first and
+        last points are always kept.
+        """
+        n = x.shape[0]
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        
+        n_buckets = n_out - 2
+        starts = np.linspace(1, n - 1, n_buckets + 1).astype(np.intp)
+        counts = np.diff(starts)
+        inner_x = np.asarray(x[1:n - 1], dtype=np.float64)
+        inner_y = np.asarray(y[1:n - 1], dtype=np.float64)
+        mean_x = np.add.reduceat(inner_x, starts[:-1] - 1) / counts
+        mean_y = np.add.reduceat(inner_y, starts[:-1] - 1) / counts
+        
+        # Anchors either side of each bucket: neighbouring bucket means, end points at the edges
+        prev_x = np.concatenate(([x[0]], mean_x[:-1]))
+        prev_y = np.concatenate(([y[0]], mean_y[:-1]))
+        next_x = np.concatenate((mean_x[1:], [x[n - 1]]))
+        next_y = np.concatenate((mean_y[1:], [y[n - 1]]))
+        
+        bucket = np.repeat(np.arange(n_buckets), counts)
+        area = np.abs((prev_x[bucket] - next_x[bucket]) * (inner_y - prev_y[bucket])
+                      - (prev_x[bucket] - inner_x) * (next_y[bucket] - prev_y[bucket]))
+        # Buckets are contiguous, so after ordering by (bucket, -area) each bucket starts with its best point
+        order = np.lexsort((-area, bucket))
+        picks = order[starts[:-1] - 1] + 1
+        return np.concatenate(([0], picks, [n - 1]))
+    
+    def _stack_verts(self, time_array: np.ndarray, proportions: np.ndarray) -> np.ndarray:
+        """Band polygons of the stacked proportions, memoized on the data content"""
+        key = hashlib.blake2b(time_array.tobytes(), digest_size=16)
+        key.update(np.ascontiguousarray(proportions).tobytes())
+        key = key.digest()
+        
+        bands = self._stack_cache.get(key)
+        if bands is None:
+            # Same polygons stackplot builds, as one (M, 2T, 2) array: each band runs
+            # forward along its running sum and back along the one below it
+            t_len, n_series = proportions.shape
+            upper = np.cumsum(proportions, axis=1)
+            lower = np.zeros_like(upper)
+            lower[:, 1:] = upper[:, :-1]
+            bands = np.empty((n_series, 2 * t_len, 2))
+            bands[:, :t_len, 0] = time_array
+            bands[:, t_len:, 0] = time_array[::-1]
+            bands[:, :t_len, 1] = upper.T
+            bands[:, t_len:, 1] = lower[::-1].T
+            
+            if len(self._stack_cache) >= 8:
+                self._stack_cache.clear()
+            self._stack_cache[key] = bands
+        return bands
+    
+    def _update_silo_timeline(self, ax: Axes, silos: List[Silo]) -> bool:
+        """
+        Move the existing Gantt bars and labels to a new silo list
+        
+        Returns:
+            bool: False when there is no bar collection to update (or no
+            silos left) and the timeline needs a re-plot
+        """
+        previous = self._plotted_silos or []
+        if self._silo_bars is None or not silos:
+            return False
+        
+        starts, durations = self._silo_schedule(silos)
+        verts = self._silo_bar_verts(starts, durations)
+        self._silo_bars.set_verts(verts)
+        if len(silos) != len(previous):
+            self._silo_bars.set_facecolors(self._silo_colors(len(silos)))
+            self._set_silo_ticks(ax, len(silos))
+        self._sync_silo_labels(ax, silos, starts, durations, previous)
+        
+        # relim() ignores collections, so rebuild the data limits from the bar corners
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(verts.reshape(-1, 2))
+        ax.autoscale_view()
+        self._plotted_silos = silos
+        return True
+    
+    @staticmethod
+    def _silo_schedule(silos: List[Silo]) -> Tuple[np.ndarray, np.ndarray]:
+        """Start times and operating durations of the silos as float arrays"""
+        count = len(silos)
+        starts = np.fromiter((silo.start_time for silo in silos), dtype=np.float64, count=count)
+        capacities = np.fromiter((silo.capacity for silo in silos), dtype=np.float64, count=count)
+        rates = np.fromiter((silo.flow_rate for silo in silos), dtype=np.float64, count=count)
+        return starts, capacities / rates
+    
+    @staticmethod
+    def _silo_bar_verts(starts: np.ndarray, durations: np.ndarray, height: float = 0.6) -> np.ndarray:
+        """Corners of one horizontal bar per silo, centred on its row index, as (N, 4, 2)"""
+        rows = np.arange(len(starts), dtype=float)
+        left, right = starts, starts + durations
+        bottom, top = rows - height / 2, rows + height / 2
+        return np.stack([np.stack([left, bottom], axis=-1), np.stack([left, top], axis=-1),
+                         np.stack([right, top], axis=-1), np.stack([right, bottom], axis=-1)], axis=1)
+    
+    @staticmethod
+    def _time_extent(time_array: np.ndarray) -> Tuple[int, float]:
+        """Number of time steps and the x-axis limit (100 s when there is no data)"""
+        t_len = time_array.shape[0]
+        return t_len, float(time_array[-1]) if t_len else 100.0
+    
+    def _plot_material_flows(self, ax: Axes, time_array: np.ndarray, flow_data: np.ndarray,
+                             materials: List[str], t_max: float):
+        """Plot individual material flows (flow_data already trimmed to the time steps)"""
+        # All materials in one LineCollection; time and total columns excluded
+        n_flows = self._flow_count(materials, flow_data)
+        handles = []
+        if n_flows:
+            cycle = rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+            colors = [cycle[i % len(cycle)] for i in range(n_flows)]
+            self._flow_lc = LineCollection(self._flow_segments(time_array, flow_data, n_flows),
+                                           linewidths=2, colors=colors)
+            ax.add_collection(self._flow_lc)
+            ax.autoscale_view()
+            # A collection has a single legend entry, so label each material with a proxy line
+            handles = [Line2D([], [], color=color, linewidth=2, label=material)
+                       for color, material in zip(colors, materials)]
+        
+        self._sync_legend(ax, handles)
+        ax.set_xlim(0, t_max)
+    
+    @staticmethod
+    def _flow_count(materials: List[str], flow_data: np.ndarray) -> int:
+        """Number of per-material flow columns to plot (time and total columns excluded)"""
+        if flow_data.ndim != 2:
+            return 0
+        material_columns = flow_data.shape[1] - 2
+        return max(min(len(materials), material_columns), 0)
+    
+    @staticmethod
+    def _flow_segments(time_array: np.ndarray, flow_data: np.ndarray, n_flows: int) -> np.ndarray:
+        """Stack the shared time axis with each flow column into (n_flows, T, 2) segments"""
+        # Filled in place: one C-contiguous (x, y) path per material, each column read once
+        segments = np.empty((n_flows, time_array.shape[0], 2), dtype=np.result_type(time_array, flow_data))
+        segments[:, :, 0] = time_array
+        segments[:, :, 1] = flow_data[:, :n_flows].T
+        return segments
+    
+    def _plot_material_proportions(self, ax: Axes, time_array: np.ndarray, proportion_data: np.ndarray,
+                                   materials: List[str], t_max: float):
         """Plot material proportions as stacked area chart"""
         if len(materials) == 0 or proportion_data.size == 0:
             ax.text(0.5, 0.5, 'No data to display', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=10)
+            self._sync_legend(ax, [])
             return
         
-        # Prepare data for stackplot
-        data_to_plot = []
-        labels_to_plot = []
-        
-        for i, material in enumerate(materials):
-            if i < proportion_data.shape[1]:
-                data_to_plot.append(proportion_data[:len(time_array), i])
-                labels_to_plot.append(material.name)
-        
-        if data_to_plot:
-            ax.stackplot(time_array, *data_to_plot, labels=labels_to_plot, alpha=0.7)
-        
-        ax.set_xlabel('Time (s)', fontsize=10)
-        ax.set_ylabel('Proportion (%)', fontsize=10)
-        ax.set_title('Material Composition', fontsize=11)
-        ax.legend(fontsize=8, loc='upper left', ncol=1)
-        ax.tick_params(labelsize=9)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, max(time_array) if len(time_array) > 0 else 100)
+        # One band per material column, all in a single PolyCollection
+        n_series = min(len(materials), proportion_data.shape[1])
+        handles = []
+        
+        if n_series:
+            cycle = rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+            colors = [cycle[i % len(cycle)] for i in range(n_series)]
+            self._stack_poly = PolyCollection(self._stack_verts(time_array, proportion_data[:, :n_series]),
+                                              facecolors=colors, alpha=0.7)
+            # Dense polygons go to vector exports as a bitmap; axes and text stay vector
+            self._stack_poly.set_rasterized(True)
+            ax.add_collection(self._stack_poly)
+            handles = [Patch(facecolor=color, alpha=0.7, label=material)
+                       for color, material in zip(colors, materials)]
+        
+        self._sync_legend(ax, handles)
+        ax.set_xlim(0, t_max)
         ax.set_ylim(0, 100)
     
-    def _plot_total_flow(self, ax: Axes, time_array: np.ndarray, flow_data: np.ndarray):
+    def _plot_total_flow(self, ax: Axes, time_array: np.ndarray, flow_data: np.ndarray, t_max: float):
         """Plot total flow rate"""
         if flow_data.size == 0:
             ax.text(0.5, 0.5, 'No data to display',
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=10)
+            self._sync_legend(ax, [])
             return
         
-        total_flow = flow_data[:len(time_array), -1]  # Last column is total
-        ax.plot(time_array, total_flow, 'b-', linewidth=2, label='Total')
+        total_flow = flow_data[:, -1]  # Last column is total
+        self._total_line, = ax.plot(time_array, total_flow, 'b-', linewidth=2, label='Total')
         
-        ax.set_xlabel('Time (s)', fontsize=10)
-        ax.set_ylabel('Total Flow Rate (kg/s)', fontsize=10)
-        ax.set_title('Total Belt Flow Rate', fontsize=11)
-        ax.legend(fontsize=8, loc='upper left')
-        ax.tick_params(labelsize=9)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(0, max(time_array) if len(time_array) > 0 else 100)
+        self._sync_legend(ax, [self._total_line])
+        ax.set_xlim(0, t_max)
     
     def _plot_silo_timeline(self, ax: Axes, silos: List[Silo]):
         """Plot silo operation timeline as Gantt chart"""
@@ -150,31 +545,60 @@ class ConveyorPlotter(BaseVisualizer):
             ax.text(0.5, 0.5, 'No silos defined',
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes)
+            ax.set_yticks([])
             return
         
-        # Create Gantt chart
+        # Create Gantt chart: every bar in one collection, coloured as successive barh calls were
+        starts, durations = self._silo_schedule(silos)
+        self._silo_bars = PolyCollection(self._silo_bar_verts(starts, durations), alpha=0.7,
+                                         facecolors=self._silo_colors(len(silos)))
+        ax.add_collection(self._silo_bars)
+        ax.autoscale_view()
+        
+        # Add text annotation
+        self._sync_silo_labels(ax, silos, starts, durations, [])
+        self._set_silo_ticks(ax, len(silos))
+    
+    @staticmethod
+    def _silo_colors(count: int) -> List[str]:
+        """Prop-cycle colours for count bars, as successive barh calls would pick them"""
+        cycle = rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+        return [cycle[i % len(cycle)] for i in range(count)]
+    
+    @staticmethod
+    def _set_silo_ticks(ax: Axes, count: int):
+        """One y tick per silo row"""
+        ax.set_yticks(range(count))
+        ax.set_yticklabels([f'Silo {i+1}' for i in range(count)], fontsize=9)
+    
+    def _sync_silo_labels(self, ax: Axes, silos: List[Silo], starts: np.ndarray,
+                          durations: np.ndarray, previous: List[Silo]):
+        """
+        Point the bar labels at the given silos
+        
+        Existing Text artists are moved and re-texted only for silos that
+        changed, so their cached layout survives; labels are created for new
+        rows and removed for rows that went away.
+        """
+        mid_times = starts + durations / 2
         for i, silo in enumerate(silos):
-            start_time = silo.start_time
-            duration = silo.capacity / silo.flow_rate
-            
-            # Create bar for silo operation
-            ax.barh(i, duration, left=start_time, height=0.6, 
-                   alpha=0.7, label=silo.material)
-            
-            # Add text annotation
-            mid_time = start_time + duration / 2
             # Simplificar a exibição do texto
-            ax.text(mid_time, i, f'{silo.material}\n{silo.flow_rate:.0f} kg/s',
-                   horizontalalignment='center', verticalalignment='center',
-                   fontsize=8)
+            text = f'{silo.material}\n{silo.flow_rate:.0f} kg/s'
+            if i < len(self._silo_labels):
+                if i < len(previous) and silo == previous[i]:
+                    continue
+                label = self._silo_labels[i]
+                label.set_position((mid_times[i], i))
+                if label.get_text() != text:
+                    label.set_text(text)
+            else:
+                self._silo_labels.append(ax.text(mid_times[i], i, text,
+                                                 horizontalalignment='center', verticalalignment='center',
+                                                 fontsize=8))
         
-        ax.set_xlabel('Time (s)', fontsize=10)
-        ax.set_ylabel('Silo Number', fontsize=10)
-        ax.set_title('Operation Schedule', fontsize=11)
-        ax.set_yticks(range(len(silos)))
-        ax.set_yticklabels([f'Silo {i+1}' for i in range(len(silos))], fontsize=9)
-        ax.tick_params(labelsize=9)
-        ax.grid(True, alpha=0.3, axis='x')
+        for label in self._silo_labels[len(silos):]:
+            label.remove()
+        del self._silo_labels[len(silos):]
     
     def clear_plots(self):
         """Clear all plots"""
@@ -182,7 +606,8 @@ class ConveyorPlotter(BaseVisualizer):
             for ax_row in self.axes_grid:
                 for ax in ax_row:
                     if ax is not None:
-                        ax.clear()
+                        self._clear_axes(ax)
+            self._forget_artists()
             self.update()
     
     def save_figure(self, filename: str, dpi: int = 300):
@@ -193,4 +618,31 @@ class ConveyorPlotter(BaseVisualizer):
             dpi (int, optional): Resolution of the output image. Defaults to 300.
         """
         if self.figure is not None:
-            self.figure.savefig(filename, dpi=dpi, bbox_inches='tight')
\ No newline at end of file
+            # Render through a plain Agg canvas rather than the Qt one
+            original_canvas = self.figure.canvas
+            FigureCanvasAgg(self.figure)
+            try:
+                self.figure.savefig(filename, dpi=dpi, bbox_inches='tight')
+            finally:
+                self.figure.set_canvas(original_canvas)
+    
+    def export_plots(self, filename: str, dpi: int = 150):
+        """Export the plots to a file
+        
+        For vector formats (PDF/SVG) dense artists such as stacked areas and
+        scatter collections are rasterized, keeping axes and text as vectors.
+        
+        Args:
+            filename (str): Path where the plots should be saved
+            dpi (int, optional): Resolution of raster output. Defaults to 150.
+        """
+        if self.figure is None:
+            return
+        
+        if os.path.splitext(filename)[1].lower() in ('.pdf', '.svg'):
+            for ax in self.figure.axes:
+                for artist in ax.get_children():
+                    if isinstance(artist, (Collection, AxesImage)):
+                        artist.set_rasterized(True)
+        
+        self.figure.savefig(filename, dpi=dpi)
\ No newline at end of file
@@ -3,12 +3,99 @@ Blast Furnace Stock House Conveyor Belt Simulation
 Specialized for ferrous material flow modeling and optimization
 """
 
+import functools
+import math
+import sys
 import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import json
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; the kernels below then run as plain Python
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@njit(cache=True, fastmath=True)
+def _beverloo_discharge_rate(outlet_diameter: float, flowability_coefficient: float,
+                             effective_bulk_density: float, moisture_content: float,
+                             max_fill_rate: float) -> float:
+    """Bunker discharge rate (m³/s) from the Beverloo equation, capped at max_fill_rate"""
+    g = 9.81  # m/s²
+    
+    # Effective outlet diameter considering material flow properties
+    effective_diameter = outlet_diameter * flowability_coefficient
+    
+    # Beverloo equation for granular flow
+    flow_coefficient = 0.58  # Typical for well-designed outlets
+    particle_size = 0.015  # m (assumed average particle size)
+    
+    # Volumetric flow rate
+    volumetric_flow = (flow_coefficient *
+                       (effective_diameter - 1.4 * particle_size) ** 2.5 *
+                       math.sqrt(g * effective_bulk_density))
+    
+    # Convert to m³/s and apply material-specific corrections
+    flow_rate = volumetric_flow / effective_bulk_density
+    
+    # Apply degradation and caking factors
+    if moisture_content > 5.0:
+        flow_rate *= 0.8  # Reduce flow for high moisture
+    
+    return min(flow_rate, max_fill_rate)  # Don't exceed design limit
+
+@njit(cache=True, fastmath=True)
+def _belt_power(length: float, width: float, speed: float, material_mass: float,
+                sin_inclination: float) -> float:
+    """Belt drive power (kW) for the given material mass on the belt"""
+    # Empty belt power
+    empty_belt_power = 0.5 * length * width * speed  # kW approximation
+    
+    # Material lifting power (if inclined)
+    if sin_inclination > 0:
+        lifting_power = material_mass * 9.81 * sin_inclination * speed / 1000  # kW
+    else:
+        lifting_power = 0.0
+    
+    # Material acceleration power
+    acceleration_power = material_mass * speed**2 / 2000  # kW approximation
+    
+    return empty_belt_power + lifting_power + acceleration_power
+
+@njit(cache=True)
+def _advance_belt(belt: np.ndarray, shift: int, exit_index: int, discharged: np.ndarray):
+    """Empty belt rows from exit_index into discharged, then shift the rest shift rows forward
+    
+    Requires exit_index <= n_positions - shift. Only used when numba is
+    available; the numpy slice version in _update_conveyor_transport is
+    faster as plain Python.
+    """
+    n_positions, n_materials = belt.shape
+    for m in range(n_materials):
+        discharged[m] = 0.0
+    for i in range(exit_index, n_positions):
+        for m in range(n_materials):
+            discharged[m] += belt[i, m]
+            belt[i, m] = 0.0
+    if shift > 0:
+        # Walk backwards so each row is read before it is overwritten
+        for i in range(exit_index - 1, -1, -1):
+            for m in range(n_materials):
+                belt[i + shift, m] = belt[i, m]
+        for i in range(min(shift, n_positions)):
+            for m in range(n_materials):
+                belt[i, m] = 0.0
+
 class FerrusMaterialType(Enum):
     """Blast furnace ferrous material types"""
     IRON_ORE_PELLETS = "iron_ore_pellets"
@@ -23,7 +110,25 @@ class FerrusMaterialType(Enum):
     PELLET_SINTER_MIX = "pellet_sinter_mix"
     ORE_FLUX_MIX = "ore_flux_mix"
 
-@dataclass
+# Small-integer tag per material type, for list indexing in the simulation hot path
+# (Enum hashing and equality go through Python-level methods)
+_MATERIAL_TYPE_TAGS = {material_type: tag for tag, material_type in enumerate(FerrusMaterialType)}
+
+@functools.lru_cache(maxsize=256)
+def _flow_rate_factor(flowability_coefficient: float, particle_size_mm: float,
+                      outlet_diameter_mm: float) -> float:
+    """Jenike flow factor; memoized since few (material, particle size, outlet) combinations occur"""
+    # Critical diameter ratio for flow
+    critical_ratio = max(5.0, 20.0 - flowability_coefficient * 10)
+    diameter_ratio = outlet_diameter_mm / particle_size_mm
+    
+    if diameter_ratio < critical_ratio:
+        return 0.1  # Poor flow
+    else:
+        flow_factor = min(1.0, (diameter_ratio - critical_ratio) / critical_ratio)
+        return 0.1 + 0.9 * flow_factor
+
+@dataclass(**_SLOTS)
 class BlastFurnaceMaterial:
     """Blast furnace specific material properties"""
     material_type: FerrusMaterialType
@@ -87,15 +192,7 @@ class BlastFurnaceMaterial:
     def calculate_flow_rate_factor(self, particle_size_mm: float, 
                                   outlet_diameter_mm: float) -> float:
         """Calculate flow rate modification factor based on Jenike theory"""
-        # Critical diameter ratio for flow
-        critical_ratio = max(5.0, 20.0 - self.flowability_coefficient * 10)
-        diameter_ratio = outlet_diameter_mm / particle_size_mm
-        
-        if diameter_ratio < critical_ratio:
-            return 0.1  # Poor flow
-        else:
-            flow_factor = min(1.0, (diameter_ratio - critical_ratio) / critical_ratio)
-            return 0.1 + 0.9 * flow_factor
+        return _flow_rate_factor(self.flowability_coefficient, particle_size_mm, outlet_diameter_mm)
 
 # Material database for blast furnace materials
 BLAST_FURNACE_MATERIALS = {
@@ -168,7 +265,13 @@ BLAST_FURNACE_MATERIALS = {
     )
 }
 
-@dataclass
+# Column of each database material in belt and bunker composition arrays
+_MATERIAL_COLUMNS = {name: column for column, name in enumerate(BLAST_FURNACE_MATERIALS)}
+
+# One recorded bunker state: results["bunker_levels"][row, bunker_column]
+bunker_rec_dtype = np.dtype([('fill_pct', 'f4'), ('mass', 'f4'), ('fe', 'f4'), ('ready', '?')])
+
+@dataclass(**_SLOTS)
 class StockHouseBunker:
     """Stock house bunker (destination silo) for blast furnace materials"""
     bunker_id: str
@@ -184,16 +287,18 @@ class StockHouseBunker:
     # Current state
     current_volume: float = 0.0  # m³ currently stored
     current_mass: float = 0.0    # kg currently stored
-    material_composition: Dict[str, float] = field(default_factory=dict)  # material -> volume
+    # m³ stored per material, indexed by _MATERIAL_COLUMNS
+    composition: np.ndarray = field(default_factory=lambda: np.zeros(len(_MATERIAL_COLUMNS)),
+                                    repr=False, compare=False)
     
     # Operational parameters
     max_fill_rate: float = 2.0  # m³/s maximum filling rate
     target_fill_level: float = 0.85  # Target fill level (85% of usable capacity)
     min_operating_level: float = 0.15  # Minimum level for continuous operation
     
-    # Quality tracking
-    average_fe_content: float = 0.0
-    average_basicity: float = 0.0
+    # Quality tracking: mass-weighted sums, averaged on demand
+    _fe_mass_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _basicity_mass_sum: float = field(default=0.0, init=False, repr=False, compare=False)
     last_quality_update: float = 0.0
     
     # Charging sequence info (for blast furnace charging)
@@ -210,6 +315,16 @@ class StockHouseBunker:
         """Available volume for additional material"""
         return max(0.0, self.usable_volume - self.current_volume)
     
+    @property
+    def average_fe_content(self) -> float:
+        """Mass-weighted average Fe content of the stored material"""
+        return self._fe_mass_sum / self.current_mass if self.current_mass else 0.0
+    
+    @property
+    def average_basicity(self) -> float:
+        """Mass-weighted average basicity of the stored material"""
+        return self._basicity_mass_sum / self.current_mass if self.current_mass else 0.0
+    
     @property
     def is_ready_for_charging(self) -> bool:
         """Check if bunker has sufficient material for blast furnace charging"""
@@ -222,54 +337,36 @@ class StockHouseBunker:
     
     def calculate_discharge_flow_rate(self, material_props: BlastFurnaceMaterial) -> float:
         """Calculate maximum discharge flow rate based on material and bunker properties"""
-        # Orifice flow calculation for granular materials
-        g = 9.81  # m/s²
-        
-        # Effective outlet diameter considering material flow properties
-        effective_diameter = self.outlet_diameter * material_props.flowability_coefficient
-        
-        # Beverloo equation for granular flow
-        flow_coefficient = 0.58  # Typical for well-designed outlets
-        particle_size = 0.015  # m (assumed average particle size)
-        
-        # Volumetric flow rate
-        volumetric_flow = (flow_coefficient * 
-                          (effective_diameter - 1.4 * particle_size) ** 2.5 * 
-                          np.sqrt(g * material_props.effective_bulk_density))
-        
-        # Convert to m³/s and apply material-specific corrections
-        flow_rate = volumetric_flow / material_props.effective_bulk_density
-        
-        # Apply degradation and caking factors
-        if material_props.moisture_content > 5.0:
-            flow_rate *= 0.8  # Reduce flow for high moisture
-        
-        return min(flow_rate, self.max_fill_rate)  # Don't exceed design limit
+        # Orifice flow calculation for granular materials (compiled when numba is available)
+        return _beverloo_discharge_rate(float(self.outlet_diameter),
+                                        float(material_props.flowability_coefficient),
+                                        float(material_props.effective_bulk_density),
+                                        float(material_props.moisture_content),
+                                        float(self.max_fill_rate))
     
     def add_material(self, material_name: str, volume: float, 
                     material_props: BlastFurnaceMaterial):
         """Add material to bunker and update composition"""
+        return self.add_material_mass(_MATERIAL_COLUMNS[material_name], volume,
+                                      volume * material_props.effective_bulk_density,
+                                      material_props.fe_content, material_props.basicity_index_B2)
+    
+    def add_material_mass(self, column: int, volume: float, mass_added: float,
+                          fe_content: float, basicity: float) -> bool:
+        """Add material by composition column with precomputed mass and quality values"""
         if volume <= 0 or volume > self.available_volume:
             return False
             
         # Update volumes
-        if material_name not in self.material_composition:
-            self.material_composition[material_name] = 0.0
-        
-        self.material_composition[material_name] += volume
+        self.composition[column] += volume
         self.current_volume += volume
         
         # Update mass
-        mass_added = volume * material_props.effective_bulk_density
         self.current_mass += mass_added
         
-        # Update quality parameters (weighted average)
-        if self.current_mass > 0:
-            weight_factor = mass_added / self.current_mass
-            self.average_fe_content = (self.average_fe_content * (1 - weight_factor) + 
-                                     material_props.fe_content * weight_factor)
-            self.average_basicity = (self.average_basicity * (1 - weight_factor) + 
-                                   material_props.basicity_index * weight_factor)
+        # Update quality sums (weighted averages are taken on demand)
+        self._fe_mass_sum += fe_content * mass_added
+        self._basicity_mass_sum += basicity * mass_added
         
         return True
     
@@ -288,7 +385,7 @@ class StockHouseBunker:
         readiness = 0.5 * fill_score + 0.3 * quality_score + 0.2 * age_score
         return readiness
 
-@dataclass
+@dataclass(**_SLOTS)
 class StockHouseConveyor:
     """Main ferrous conveyor belt in blast furnace stock house"""
     conveyor_id: str
@@ -315,7 +412,16 @@ class StockHouseConveyor:
     
     # Material distribution along belt
     position_resolution: float = 1.0  # m resolution for material tracking
-    material_distribution: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    
+    # Derived in __post_init__
+    n_positions: int = field(init=False, repr=False, compare=False)
+    material_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    belt: np.ndarray = field(init=False, repr=False, compare=False)
+    _cross_sectional_area: float = field(init=False, repr=False, compare=False)
+    _volumetric_capacity_per_position: float = field(init=False, repr=False, compare=False)
+    _sin_incl: float = field(init=False, repr=False, compare=False)
+    _step_key: Optional[Tuple[float, float]] = field(init=False, default=None, repr=False, compare=False)
+    _step_geometry: Tuple[int, int] = field(init=False, default=(0, 0), repr=False, compare=False)
     
     def __post_init__(self):
         if self.current_speed is None:
@@ -323,19 +429,58 @@ class StockHouseConveyor:
         
         # Initialize position tracking
         self.n_positions = int(self.length / self.position_resolution) + 1
-        self.positions = np.linspace(0, self.length, self.n_positions)
+        
+        # Material volumes on the belt: one row per position, one column per material (m³)
+        self.material_index = _MATERIAL_COLUMNS
+        self.belt = np.zeros((self.n_positions, len(self.material_index)), dtype=np.float32)
+        
+        # Belt geometry is fixed for a run, so the derived capacities are computed once
+        # Trapezoidal cross-section approximation
+        base_width = self.width * 0.9  # Effective width (accounting for belt edges)
+        self._cross_sectional_area = base_width * self.max_material_height / 2  # Triangular approximation
+        self._volumetric_capacity_per_position = self._cross_sectional_area * self.position_resolution
+        self._sin_incl = math.sin(math.radians(self.inclination_angle)) if self.inclination_angle > 0 else 0.0
+    
+    def step_geometry(self, time_step: float) -> Tuple[int, int]:
+        """
+        Integer transport geometry for one time step at the current speed
+        
+        Returns:
+            (shift, exit_index): rows the material advances per step, and the
+            first row that reaches the head pulley within a step. Recomputed
+            only when the speed or time step changes.
+        """
+        key = (self.current_speed, time_step)
+        if key != self._step_key:
+            distance = self.current_speed * time_step
+            shift = int(distance / self.position_resolution)
+            # Row i sits at i * spacing (spacing == position_resolution when it divides the length);
+            # the first exiting row is the first one within `distance` of the head pulley
+            remaining = self.length - distance
+            if remaining <= 0:
+                exit_index = 0
+            elif self.n_positions > 1:
+                spacing = self.length / (self.n_positions - 1)
+                exit_index = min(math.ceil(remaining / spacing), self.n_positions)
+            else:
+                exit_index = self.n_positions
+            self._step_geometry = (shift, exit_index)
+            self._step_key = key
+        return self._step_geometry
+    
+    def load_material(self, material_name: str, volume: float, position_index: int = 0):
+        """Place material volume (m³) on the belt at a position (the loading point by default)"""
+        self.belt[position_index, self.material_index[material_name]] += volume
     
     @property
     def cross_sectional_area(self) -> float:
-        """Calculate cross-sectional area of material on belt"""
-        # Trapezoidal cross-section approximation
-        base_width = self.width * 0.9  # Effective width (accounting for belt edges)
-        return base_width * self.max_material_height / 2  # Triangular approximation
+        """Cross-sectional area of material on belt (computed in __post_init__)"""
+        return self._cross_sectional_area
     
     @property
     def volumetric_capacity_per_position(self) -> float:
-        """Volume capacity per position segment"""
-        return self.cross_sectional_area * self.position_resolution
+        """Volume capacity per position segment (computed in __post_init__)"""
+        return self._volumetric_capacity_per_position
     
     @property
     def theoretical_capacity_tph(self) -> float:
@@ -349,45 +494,31 @@ class StockHouseConveyor:
         """Calculate power requirement in kW"""
         # Simplified power calculation
         # P = (belt resistance + material lifting + acceleration) forces × velocity
-        
-        # Empty belt power
-        empty_belt_power = 0.5 * self.length * self.width * self.current_speed  # kW approximation
-        
-        # Material lifting power (if inclined)
-        if self.inclination_angle > 0:
-            lifting_power = (total_material_mass * 9.81 * 
-                           np.sin(np.radians(self.inclination_angle)) * 
-                           self.current_speed / 1000)  # kW
-        else:
-            lifting_power = 0.0
-        
-        # Material acceleration power
-        acceleration_power = total_material_mass * self.current_speed**2 / 2000  # kW approximation
-        
-        return empty_belt_power + lifting_power + acceleration_power
+        return _belt_power(float(self.length), float(self.width), float(self.current_speed),
+                           float(total_material_mass), self._sin_incl)
     
     def check_belt_loading(self) -> Dict[str, float]:
         """Check belt loading conditions and return status"""
-        total_volume = sum(
-            sum(materials.values()) 
-            for materials in self.material_distribution.values()
-        )
+        capacity = self._volumetric_capacity_per_position
+        if capacity <= 0:
+            return {"total_loading_percentage": 0, "load_distribution_std": 0,
+                    "overloaded_positions": 0, "max_position_load": 0}
         
-        max_volume = self.n_positions * self.volumetric_capacity_per_position
-        loading_percentage = (total_volume / max_volume) * 100 if max_volume > 0 else 0
+        # Percent load of every position from one row reduction; the belt average is the total loading
+        loads = self.belt.sum(axis=1, dtype=np.float64) * (100.0 / capacity)
+        loading_percentage = float(loads.mean())
         
-        # Calculate load distribution evenness
-        position_loads = [
-            sum(materials.values()) / self.volumetric_capacity_per_position * 100
-            for materials in self.material_distribution.values()
-        ]
-        load_std = np.std(position_loads) if position_loads else 0
+        # Calculate load distribution evenness over the positions carrying material
+        position_loads = loads[loads > 0]
+        if not position_loads.size:
+            return {"total_loading_percentage": loading_percentage, "load_distribution_std": 0,
+                    "overloaded_positions": 0, "max_position_load": 0}
         
         return {
             "total_loading_percentage": loading_percentage,
-            "load_distribution_std": load_std,
-            "overloaded_positions": sum(1 for load in position_loads if load > 90),
-            "max_position_load": max(position_loads) if position_loads else 0
+            "load_distribution_std": float(position_loads.std()),
+            "overloaded_positions": int(np.count_nonzero(position_loads > 90)),
+            "max_position_load": float(position_loads.max())
         }
 
 class BlastFurnaceConveyorSimulation:
@@ -396,23 +527,28 @@ class BlastFurnaceConveyorSimulation:
     def __init__(self):
         self.conveyors: List[StockHouseConveyor] = []
         self.bunkers: List[StockHouseBunker] = []
+        # Bunkers grouped by designation, indexed by material type tag
+        self._bunkers_by_tag: List[List[StockHouseBunker]] = [[] for _ in _MATERIAL_TYPE_TAGS]
         self.materials_db = BLAST_FURNACE_MATERIALS
         
+        # Flat per-material property arrays for the transfer hot path, in belt column order
+        self.material_index = _MATERIAL_COLUMNS
+        materials = list(self.materials_db.values())
+        self.mat_bulk_density = np.array([m.effective_bulk_density for m in materials], dtype=np.float64)
+        self.mat_fe = np.array([m.fe_content for m in materials], dtype=np.float64)
+        self.mat_basicity = np.array([m.basicity_index_B2 for m in materials], dtype=np.float64)
+        self.mat_type_tags = [_MATERIAL_TYPE_TAGS[m.material_type] for m in materials]
+        # Per-conveyor discharge buffer for _advance_belt, consumed before the next conveyor
+        self._discharged = np.zeros(len(materials))
+        
         # Simulation parameters
         self.time_step = 1.0  # seconds
         self.current_time = 0.0
         self.total_simulation_time = 3600.0  # 1 hour default
+        self.record_interval = 10  # time steps between recorded result rows
         
-        # Results tracking
-        self.results = {
-            "time_series": [],
-            "bunker_levels": [],
-            "conveyor_loads": [],
-            "material_quality": [],
-            "power_consumption": [],
-            "charging_readiness": [],
-            "mass_balance": []
-        }
+        # Results tracking (sized per run by _allocate_results)
+        self._allocate_results(0)
     
     def add_conveyor(self, conveyor: StockHouseConveyor):
         """Add conveyor to simulation"""
@@ -421,86 +557,147 @@ class BlastFurnaceConveyorSimulation:
     def add_bunker(self, bunker: StockHouseBunker):
         """Add bunker to simulation"""
         self.bunkers.append(bunker)
+        self._bunkers_by_tag[_MATERIAL_TYPE_TAGS[bunker.material_designation]].append(bunker)
     
-    def run_simulation(self, total_time: float = 3600.0):
-        """Run the blast furnace stock house simulation"""
+    def run_simulation(self, total_time: float = 3600.0, block_steps: int = 1):
+        """
+        Run the blast furnace stock house simulation
+        
+        Args:
+            total_time: Simulated time in seconds
+            block_steps: Time steps advanced per loop iteration. Belt transport
+                over a block is applied as one array shift; 1 keeps per-step
+                transport.
+        
+        Results are recorded at the first block starting at or after every
+        record_interval time steps (and at t = 0); the physics still runs on
+        every step.
+        """
         self.total_simulation_time = total_time
         self.current_time = 0.0
+        block_steps = max(1, int(block_steps))
+        record_interval = max(1, int(self.record_interval))
+        total_steps = math.ceil(total_time / self.time_step)
+        self._allocate_results(-(-total_steps // max(block_steps, record_interval)) + 1)
+        next_record_step = 0
         
-        while self.current_time < self.total_simulation_time:
-            # Update material transport on all conveyors
-            self._update_conveyor_transport()
+        for first_step in range(0, total_steps, block_steps):
+            steps = min(block_steps, total_steps - first_step)
+            self.current_time = first_step * self.time_step
             
-            # Process material transfer to bunkers
-            self._process_bunker_filling()
+            # Update material transport on all conveyors; discharged material
+            # is transferred to bunkers there (_queue_for_bunker_transfer)
+            self._update_conveyor_transport(steps)
             
             # Update bunker states and quality
             self._update_bunker_quality()
             
-            # Check charging readiness
-            self._evaluate_charging_readiness()
-            
-            # Record results
-            self._record_timestep_results()
-            
-            # Advance time
-            self.current_time += self.time_step
+            if first_step >= next_record_step:
+                # Check charging readiness
+                self._evaluate_charging_readiness()
+                
+                # Record results
+                self._record_timestep_results()
+                self._record_index += 1
+                next_record_step = (first_step // record_interval + 1) * record_interval
         
+        self.current_time = total_steps * self.time_step
+        self._trim_results()
         return self._generate_final_results()
     
-    def _update_conveyor_transport(self):
-        """Update material movement on conveyors"""
+    def _trim_results(self):
+        """Cut the preallocated result arrays down to the rows actually recorded"""
+        rows = self._record_index
+        for key, value in self.results.items():
+            if isinstance(value, np.ndarray):
+                self.results[key] = value[:rows]
+            elif isinstance(value, dict):
+                for stat, column_values in value.items():
+                    value[stat] = column_values[:rows]
+    
+    def _allocate_results(self, n_records: int):
+        """Preallocate result arrays: one row per recorded timestep, one column per bunker/conveyor
+        
+        Rows are left uninitialised; every row is written in full before
+        _trim_results cuts the arrays to the recorded count.
+        """
+        n_bunkers = len(self.bunkers)
+        n_conveyors = len(self.conveyors)
+        self._record_index = 0
+        self.results = {
+            "time_series": np.empty(n_records, dtype=np.float64),
+            "bunker_ids": [bunker.bunker_id for bunker in self.bunkers],
+            "conveyor_ids": [conveyor.conveyor_id for conveyor in self.conveyors],
+            # Columnar bunker states, e.g. results["bunker_levels"]["fill_pct"].mean(axis=1)
+            "bunker_levels": np.empty((n_records, n_bunkers), dtype=bunker_rec_dtype),
+            # One (n_records, n_conveyors) array per check_belt_loading statistic
+            "conveyor_loads": {
+                key: np.empty((n_records, n_conveyors), dtype=np.float32)
+                for key in ("total_loading_percentage", "load_distribution_std",
+                            "overloaded_positions", "max_position_load")
+            },
+            "material_quality": [],
+            "power_consumption": [],
+            "charging_readiness": np.empty((n_records, n_bunkers), dtype=np.float32),
+            "mass_balance": []
+        }
+    
+    def _update_conveyor_transport(self, steps: int = 1):
+        """Update material movement on conveyors over one or more time steps"""
         for conveyor in self.conveyors:
             if not conveyor.is_running:
                 continue
                 
             # Transport materials along belt
-            new_distribution = {}
-            distance_per_timestep = conveyor.current_speed * self.time_step
+            shift, exit_index = conveyor.step_geometry(self.time_step)
+            belt = conveyor.belt
             
-            for pos_index, materials in conveyor.material_distribution.items():
-                current_position = conveyor.positions[pos_index]
-                new_position = current_position + distance_per_timestep
+            # Positions that pass the head pulley within these steps - transfer to bunkers.
+            # A row leaves if it reaches the single-step exit rows after steps - 1 shifts.
+            exit_index -= (steps - 1) * shift
+            shift *= steps
+            exit_index = max(0, min(exit_index, conveyor.n_positions - shift))
+            if HAS_NUMBA:
+                discharged = self._discharged
+                _advance_belt(belt, shift, exit_index, discharged)
+            else:
+                discharged = belt[exit_index:].sum(axis=0)
+                belt[exit_index:] = 0.0
                 
-                if new_position >= conveyor.length:
-                    # Material reaches end - transfer to bunkers
-                    self._queue_for_bunker_transfer(materials, conveyor)
-                else:
-                    # Material continues on belt
-                    new_pos_index = int(new_position / conveyor.position_resolution)
-                    if new_pos_index not in new_distribution:
-                        new_distribution[new_pos_index] = {}
-                    
-                    for material, volume in materials.items():
-                        if material not in new_distribution[new_pos_index]:
-                            new_distribution[new_pos_index][material] = 0.0
-                        new_distribution[new_pos_index][material] += volume
+                # Material continues on belt: shift the remaining rows in one slice assignment
+                if shift:
+                    belt[shift:shift + exit_index] = belt[:exit_index]
+                    belt[:shift] = 0.0
             
-            conveyor.material_distribution = new_distribution
+            if discharged.any():
+                self._queue_for_bunker_transfer(discharged, conveyor)
     
-    def _queue_for_bunker_transfer(self, materials: Dict[str, float], 
+    def _queue_for_bunker_transfer(self, volumes: np.ndarray, 
                                    conveyor: StockHouseConveyor):
-        """Queue materials for transfer to appropriate bunkers"""
-        for material_name, volume in materials.items():
-            if material_name in self.materials_db:
-                material_props = self.materials_db[material_name]
-                target_bunker = self._find_target_bunker(material_props.material_type)
-                
-                if target_bunker and target_bunker.available_volume >= volume:
-                    target_bunker.add_material(material_name, volume, material_props)
+        """Queue discharged volumes (one per belt material column) for transfer to bunkers"""
+        masses = volumes * self.mat_bulk_density  # Same column order as the belt
+        for column in np.flatnonzero(volumes > 0):
+            volume = float(volumes[column])
+            target_bunker = self._lowest_fill_bunker(self._bunkers_by_tag[self.mat_type_tags[column]])
+            
+            if target_bunker and target_bunker.available_volume >= volume:
+                target_bunker.add_material_mass(column, volume, float(masses[column]),
+                                                float(self.mat_fe[column]), float(self.mat_basicity[column]))
     
     def _find_target_bunker(self, material_type: FerrusMaterialType) -> Optional[StockHouseBunker]:
         """Find appropriate bunker for material type"""
-        compatible_bunkers = [
-            bunker for bunker in self.bunkers 
-            if bunker.material_designation == material_type and bunker.needs_filling
-        ]
-        
-        if not compatible_bunkers:
-            return None
-        
-        # Choose bunker with lowest fill level
-        return min(compatible_bunkers, key=lambda b: b.fill_percentage)
+        return self._lowest_fill_bunker(self._bunkers_by_tag[_MATERIAL_TYPE_TAGS[material_type]])
+    
+    @staticmethod
+    def _lowest_fill_bunker(bunkers: List[StockHouseBunker]) -> Optional[StockHouseBunker]:
+        """Bunker needing material with the lowest fill level, from one designation group"""
+        target = None
+        lowest_fill = None
+        for bunker in bunkers:
+            fill = bunker.fill_percentage
+            if fill < bunker.target_fill_level * 100 and (lowest_fill is None or fill < lowest_fill):
+                target, lowest_fill = bunker, fill
+        return target
     
     def _update_bunker_quality(self):
         """Update quality parameters for all bunkers"""
@@ -509,32 +706,30 @@ class BlastFurnaceConveyorSimulation:
             # Quality updates would be based on material composition
     
     def _evaluate_charging_readiness(self):
-        """Evaluate blast furnace charging readiness"""
-        charging_scores = {}
-        for bunker in self.bunkers:
-            charging_scores[bunker.bunker_id] = bunker.calculate_charging_readiness_score()
+        """Evaluate blast furnace charging readiness and record it for this timestep"""
+        fill = np.fromiter((bunker.current_volume / bunker.usable_volume for bunker in self.bunkers),
+                           dtype=np.float64, count=len(self.bunkers)) * 100.0
+        # Same as calculate_charging_readiness_score while the quality and age
+        # components are fixed at 1.0: 0.5 * fill score + 0.3 + 0.2
+        self.results["charging_readiness"][self._record_index] = 0.5 * np.minimum(fill / 85.0, 1.0) + 0.5
     
     def _record_timestep_results(self):
-        """Record simulation results for current timestep"""
-        self.results["time_series"].append(self.current_time)
+        """Record simulation results for current timestep into the preallocated rows"""
+        row = self._record_index
+        results = self.results
+        results["time_series"][row] = self.current_time
         
         # Bunker levels
-        bunker_data = {}
-        for bunker in self.bunkers:
-            bunker_data[bunker.bunker_id] = {
-                "fill_percentage": bunker.fill_percentage,
-                "current_mass": bunker.current_mass,
-                "fe_content": bunker.average_fe_content,
-                "charging_ready": bunker.is_ready_for_charging
-            }
-        self.results["bunker_levels"].append(bunker_data)
+        bunker_levels = results["bunker_levels"]
+        for column, bunker in enumerate(self.bunkers):
+            bunker_levels[row, column] = (bunker.fill_percentage, bunker.current_mass,
+                                          bunker.average_fe_content, bunker.is_ready_for_charging)
         
         # Conveyor loads
-        conveyor_data = {}
-        for conveyor in self.conveyors:
-            loading_status = conveyor.check_belt_loading()
-            conveyor_data[conveyor.conveyor_id] = loading_status
-        self.results["conveyor_loads"].append(conveyor_data)
+        conveyor_loads = results["conveyor_loads"]
+        for column, conveyor in enumerate(self.conveyors):
+            for key, value in conveyor.check_belt_loading().items():
+                conveyor_loads[key][row, column] = value
     
     def _generate_final_results(self):
         """Generate final simulation results"""
@@ -567,6 +762,34 @@ class BlastFurnaceConveyorSimulation:
             }
         }
 
+# Example stock house bunker groups: (id prefix, material, count, shared StockHouseBunker parameters)
+_EXAMPLE_BUNKER_GROUPS = [
+    ("PELLET", FerrusMaterialType.IRON_ORE_PELLETS, 4, dict(
+        capacity_volume=200.0,      # 200 m³
+        usable_volume=170.0,        # 170 m³ usable
+        cross_sectional_area=25.0,  # 25 m²
+        outlet_diameter=1.2,        # 1.2m outlet
+        height=12.0,                # 12m height
+        max_fill_rate=3.0,          # 3 m³/s fill rate
+    )),
+    ("SINTER", FerrusMaterialType.IRON_ORE_SINTER, 3, dict(
+        capacity_volume=180.0,
+        usable_volume=150.0,
+        cross_sectional_area=22.0,
+        outlet_diameter=1.0,
+        height=10.0,
+        max_fill_rate=2.5,
+    )),
+    ("COKE", FerrusMaterialType.COKE, 2, dict(
+        capacity_volume=250.0,      # Larger volume due to lower density
+        usable_volume=220.0,
+        cross_sectional_area=30.0,
+        outlet_diameter=1.5,        # Larger outlet for coke
+        height=15.0,
+        max_fill_rate=4.0,
+    )),
+]
+
 # Example usage for blast furnace stock house
 def create_blast_furnace_example():
     """Create example blast furnace stock house configuration"""
@@ -586,50 +809,17 @@ def create_blast_furnace_example():
     )
     sim.add_conveyor(main_conveyor)
     
-    # Iron ore pellet bunkers
-    for i in range(4):  # 4 pellet bunkers
-        bunker = StockHouseBunker(
-            bunker_id=f"PELLET_BUNKER_{i+1:02d}",
-            material_designation=FerrusMaterialType.IRON_ORE_PELLETS,
-            capacity_volume=200.0,  # 200 m³
-            usable_volume=170.0,    # 170 m³ usable
-            cross_sectional_area=25.0,  # 25 m²
-            outlet_diameter=1.2,    # 1.2m outlet
-            height=12.0,           # 12m height
-            max_fill_rate=3.0,     # 3 m³/s fill rate
-            charging_sequence_position=i+1
-        )
-        sim.add_bunker(bunker)
-    
-    # Sinter bunkers
-    for i in range(3):  # 3 sinter bunkers
-        bunker = StockHouseBunker(
-            bunker_id=f"SINTER_BUNKER_{i+1:02d}",
-            material_designation=FerrusMaterialType.IRON_ORE_SINTER,
-            capacity_volume=180.0,
-            usable_volume=150.0,
-            cross_sectional_area=22.0,
-            outlet_diameter=1.0,
-            height=10.0,
-            max_fill_rate=2.5,
-            charging_sequence_position=i+5  # After pellets
-        )
-        sim.add_bunker(bunker)
-    
-    # Coke bunkers
-    for i in range(2):  # 2 coke bunkers
-        bunker = StockHouseBunker(
-            bunker_id=f"COKE_BUNKER_{i+1:02d}",
-            material_designation=FerrusMaterialType.COKE,
-            capacity_volume=250.0,  # Larger volume due to lower density
-            usable_volume=220.0,
-            cross_sectional_area=30.0,
-            outlet_diameter=1.5,    # Larger outlet for coke
-            height=15.0,
-            max_fill_rate=4.0,
-            charging_sequence_position=i+8  # After iron ore materials
-        )
-        sim.add_bunker(bunker)
+    # Bunker groups in charging sequence order: pellets, sinter, then coke
+    sequence_position = 1
+    for prefix, material_type, n_bunkers, params in _EXAMPLE_BUNKER_GROUPS:
+        for i in range(n_bunkers):
+            sim.add_bunker(StockHouseBunker(
+                bunker_id=f"{prefix}_BUNKER_{i+1:02d}",
+                material_designation=material_type,
+                charging_sequence_position=sequence_position,
+                **params
+            ))
+            sequence_position += 1
     
     return sim
 